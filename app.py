@@ -1,18 +1,102 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, g, request, jsonify, render_template, send_from_directory, stream_with_context
 import os
+import io
 import json
 import re
 from werkzeug.utils import secure_filename
-import pdfplumber
-from docx import Document
 import logging
-from collections import Counter
+import hashlib
+import hmac
+import pickle
+import threading
+import time
+import shutil
+import tempfile
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import (FIRST_COMPLETED, BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed, wait)
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from text_cache import ExtractedTextCache
+from jobs import JobManager
+from candidate_index import CandidateIndex
+from metrics import Metrics, server_timing_header
+from extraction_sandbox import ExtractionSandbox, STATUS_OK, STATUS_OOM, STATUS_PARSE_ERROR
+from archives import ArchiveError, ArchiveReader, is_archive
+from docx_text import read_docx_text
+from dedup import NearDuplicateIndex
+
+# The PDF libraries are imported on first use: pdfplumber pulls in pdfminer and Pillow, which take
+# longer to import than the rest of the app, so processes that never read a PDF skip the cost.
+# Processes with an extraction sandbox import them up front instead; see create_extraction_sandbox.
+@lru_cache(maxsize=None)
+def _pdfplumber():
+    import pdfplumber
+    return pdfplumber
+
+@lru_cache(maxsize=None)
+def _pdfium():
+    """pypdfium2, or None when it is not installed; fast PDF mode then falls back to pdfplumber's layout-free extraction"""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+    return pdfium
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  
 app.config['UPLOAD_FOLDER'] = 'uploads'
-
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Uploads are parsed in memory; non-seekable streams spill to disk past this size
+app.config['UPLOAD_SPOOL_MAX_MEMORY'] = 1024 * 1024
+# SQLite file shared by every worker; set RESUME_SCANNER_TEXT_CACHE='' to disable
+app.config['TEXT_CACHE_PATH'] = os.environ.get('RESUME_SCANNER_TEXT_CACHE', os.path.join('cache', 'extracted_text.sqlite3'))
+app.config['TEXT_CACHE_MAX_BYTES'] = int(os.environ.get('RESUME_SCANNER_TEXT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+# Background batch jobs: worker threads and how long finished results are kept (seconds)
+app.config['JOB_WORKERS'] = int(os.environ.get('RESUME_SCANNER_JOB_WORKERS', 2))
+app.config['JOB_RESULT_TTL'] = int(os.environ.get('RESUME_SCANNER_JOB_RESULT_TTL', 3600))
+# JD relevance: 'ngram' looks phrases up in a per-resume index, 'substring' reproduces legacy scores
+app.config['RELEVANCE_MODE'] = os.environ.get('RESUME_SCANNER_RELEVANCE_MODE', 'ngram')
+# Persistent pool of ingested candidates searched by POST /candidates/search
+app.config['CANDIDATE_INDEX_PATH'] = os.environ.get('RESUME_SCANNER_CANDIDATE_INDEX', os.path.join('data', 'candidate_index.sqlite3'))
+# Poll skills.json every N seconds and swap in edits without a restart (0 disables the watcher)
+app.config['SKILLS_RELOAD_INTERVAL'] = float(os.environ.get('RESUME_SCANNER_SKILLS_RELOAD_INTERVAL', 0))
+# Optional pickled SkillTaxonomy compiled from skills.json, rebuilt whenever the file's digest changes, so
+# new workers load it instead of recompiling; off unless a path is set. The file is unpickled at start-up,
+# so only point it somewhere no one the service does not trust can write.
+app.config['SKILLS_SNAPSHOT_PATH'] = os.environ.get('RESUME_SCANNER_SKILLS_SNAPSHOT', '')
+# Token for the /admin endpoints, sent as X-Admin-Token; they are disabled while it is unset
+app.config['ADMIN_TOKEN'] = os.environ.get('RESUME_SCANNER_ADMIN_TOKEN', '')
+# PDF extraction: 'accurate' runs pdfplumber's layout analysis on every page, 'fast' reads
+# layout-free text up to the page/character caps. Requests may pick one with extractionMode.
+app.config['PDF_EXTRACTION_MODE'] = os.environ.get('RESUME_SCANNER_PDF_MODE', 'accurate')
+app.config['FAST_PDF_MAX_PAGES'] = int(os.environ.get('RESUME_SCANNER_FAST_PDF_MAX_PAGES', 10))
+app.config['FAST_PDF_MAX_CHARS'] = int(os.environ.get('RESUME_SCANNER_FAST_PDF_MAX_CHARS', 100000))
+# PDF/DOCX extraction runs in supervised child processes, each file limited to EXTRACTION_TIMEOUT
+# seconds and EXTRACTION_MEMORY_LIMIT bytes; set RESUME_SCANNER_EXTRACTION_ISOLATION=0 to extract in-process
+app.config['EXTRACTION_ISOLATION'] = os.environ.get('RESUME_SCANNER_EXTRACTION_ISOLATION', '1') == '1'
+app.config['EXTRACTION_TIMEOUT'] = float(os.environ.get('RESUME_SCANNER_EXTRACTION_TIMEOUT', 30))
+app.config['EXTRACTION_MEMORY_LIMIT'] = int(os.environ.get('RESUME_SCANNER_EXTRACTION_MEMORY_LIMIT', 512 * 1024 * 1024))
+# At least two children, so one stuck file never leaves the rest of a batch waiting on its timeout
+app.config['EXTRACTION_WORKERS'] = int(os.environ.get('RESUME_SCANNER_EXTRACTION_WORKERS', 0)) or max(2, os.cpu_count())
+# .zip/.tar/.tar.gz uploads are unpacked in memory member by member; archives over these limits are rejected
+app.config['ARCHIVE_MAX_MEMBERS'] = int(os.environ.get('RESUME_SCANNER_ARCHIVE_MAX_MEMBERS', 1000))
+app.config['ARCHIVE_MAX_BYTES'] = int(os.environ.get('RESUME_SCANNER_ARCHIVE_MAX_BYTES', 256 * 1024 * 1024))
+app.config['ARCHIVE_MAX_MEMBER_BYTES'] = int(os.environ.get('RESUME_SCANNER_ARCHIVE_MAX_MEMBER_BYTES', 16 * 1024 * 1024))
+# Prometheus metrics at /metrics; Server-Timing is added to every response, or per request with ?timing=1.
+# Stages run inside 'process' workers are not recorded.
+app.config['METRICS_ENABLED'] = os.environ.get('RESUME_SCANNER_METRICS', '1') == '1'
+app.config['SERVER_TIMING'] = os.environ.get('RESUME_SCANNER_SERVER_TIMING', '0') == '1'
+# Resumes of the same candidate in one batch (same email or phone, or MinHash similarity of their word
+# trigrams at least DEDUP_THRESHOLD) are scored once; requests may send deduplicate=off. Streams and
+# jobs pick the first copy to arrive as the representative. In the 'process' execution mode workers
+# still score every copy, and the later ones are reported as duplicates.
+app.config['DEDUPLICATE'] = os.environ.get('RESUME_SCANNER_DEDUPLICATE', '1') == '1'
+app.config['DEDUP_THRESHOLD'] = float(os.environ.get('RESUME_SCANNER_DEDUP_THRESHOLD', 0.8))
+# Most job descriptions one /analyze/matrix request may compare a pool against
+app.config['MATRIX_MAX_JOBS'] = int(os.environ.get('RESUME_SCANNER_MATRIX_MAX_JOBS', 20))
+# 'serial' scores uploads in the request thread, 'process' fans them out to a worker pool
+app.config['ANALYZE_EXECUTION'] = os.environ.get('RESUME_SCANNER_EXECUTION', 'serial')
+app.config['ANALYZE_WORKERS'] = int(os.environ.get('RESUME_SCANNER_WORKERS', 0)) or os.cpu_count()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,19 +104,643 @@ logger = logging.getLogger(__name__)
 EMAIL_REGEX = r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
 PHONE_REGEX = r'(\+?\d{1,2}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)\d{3}[-.\s]?\d{4}'
 
+CULTURE_KEYWORD_REGEX = r'\b(?:culture|values|team|collaboration|innovation|growth|learning|flexibility|remote|work-life|balance|diversity|inclusion)\b'
+STANDARD_CULTURE_TRAITS = [
+    'team', 'collaborate', 'integrity', 'respect',
+    'growth', 'learning', 'flexibility', 'balance',
+    'ownership', 'transparency', 'innovation', 'communication'
+]
+HIGH_VALUE_KEYWORDS = [
+    'machine learning', 'ai', 'blockchain', 'cloud architect',
+    'devops', 'security', 'data scientist', 'full stack',
+    'lead', 'senior', 'principal', 'architect'
+]
+SKILL_CATEGORIES = ['technical', 'soft', 'certifications']
+# Base score per found skill, plus a bonus when the JD itself asks for the skill
+SKILL_CATEGORY_WEIGHTS = {'technical': 2, 'soft': 1, 'certifications': 1.5}
+JD_SKILL_MATCH_BONUS = 3
+
+# 'ngram' looks distinct JD phrases up in a per-resume phrase index;
+# 'substring' keeps the legacy per-phrase scan that counts repeated phrases
+RELEVANCE_MODES = ('ngram', 'substring')
+
+# Bump whenever an extractor's output changes so cached text is invalidated
+EXTRACTOR_VERSION = 2
+# File types with an extractor
+RESUME_FILE_TYPES = ('pdf', 'docx', 'txt')
+# File types whose extraction is expensive enough to be worth caching
+CACHED_FILE_TYPES = ('pdf', 'docx')
+
+EXTRACTION_MODES = ('accurate', 'fast')
+# File types whose extractor honours the fast mode; every other type is always read in full
+FAST_EXTRACTION_TYPES = ('pdf',)
+# File types whose parsers are complex enough to hang or blow up on hostile input
+SANDBOXED_FILE_TYPES = ('pdf', 'docx')
+# Per-file statuses besides the extraction ones: no text in the file, or scoring it failed
+STATUS_EMPTY = 'empty'
+STATUS_ERROR = 'error'
+# An uploaded archive that is corrupt or over the ARCHIVE_* limits
+STATUS_ARCHIVE_ERROR = 'archive_error'
+# A resume of a candidate already in the batch; it points to the copy that was scored
+STATUS_DUPLICATE = 'duplicate'
+
+
+def _as_binary_source(source):
+    """Extractors take a path or a binary stream; raw bytes are wrapped in a stream"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+
+def _read_source_bytes(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            return file.read()
+    return source.read()
+
+
+def create_text_cache(path, max_bytes):
+    """Open the shared extracted-text cache, or return None when it is disabled"""
+    if not path:
+        return None
+    return ExtractedTextCache(path, max_bytes=max_bytes, version=EXTRACTOR_VERSION)
+
+
+def create_extraction_sandbox(resume_analyzer, workers):
+    """Sandbox for the analyzer's PDF/DOCX extraction, or None when isolation is off or unsupported here"""
+    if not app.config['EXTRACTION_ISOLATION']:
+        return None
+    # Children are forked on demand from whichever thread needs one. A child forked while another thread
+    # is still importing a PDF library inherits that module's import lock held and hangs on its first PDF,
+    # so the imports are done here, before any child exists.
+    _pdfplumber()
+    _pdfium()
+    try:
+        return ExtractionSandbox(resume_analyzer.read_text_by_type, workers=workers,
+                                 timeout=app.config['EXTRACTION_TIMEOUT'],
+                                 memory_limit=app.config['EXTRACTION_MEMORY_LIMIT'])
+    except RuntimeError as e:
+        logger.warning(f"Extracting in-process: {e}")
+        return None
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+def _bit_counts(bits):
+    """Group bits by how many entries share them, as (mask, count) pairs, so entries can be counted by popcount"""
+    masks = {}
+    for bit, count in Counter(bits).items():
+        masks[count] = masks.get(count, 0) | bit
+    return [(mask, count) for count, mask in masks.items()]
+
+
+def _count_entries(skills, bit_counts):
+    """How many entries of a _bit_counts list a skill bitset covers"""
+    return sum((skills & mask).bit_count() * count for mask, count in bit_counts)
+
+
+class SkillMatcher:
+    """Word-boundary aware matcher compiled once over a skill vocabulary.
+
+    Skills are lowercased and deduplicated at build time. ``match`` scans a
+    lowercased text with C-level ``str.find`` and only accepts hits that are
+    not glued to neighbouring word characters, so "AI" no longer matches
+    inside "maintain" while "C++" and "Node.js" still match.
+    """
+
+    def __init__(self, patterns=()):
+        self.patterns = {}
+        self.extend(patterns)
+
+    def __contains__(self, pattern):
+        return pattern.lower() in self.patterns
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def extend(self, patterns):
+        for pattern in patterns:
+            key = pattern.lower().strip()
+            if key and key not in self.patterns:
+                # Boundaries only matter on sides that end in a word character
+                self.patterns[key] = (_is_word_char(key[0]), _is_word_char(key[-1]))
+
+    @classmethod
+    def union(cls, matchers):
+        """Matcher over the patterns of several matchers, reusing their compiled entries"""
+        merged = cls()
+        for matcher in matchers:
+            merged.patterns.update(matcher.patterns)
+        return merged
+    
+    def subset(self, patterns):
+        """Matcher over some of these patterns, reusing their compiled entries; unknown ones are added"""
+        matcher = SkillMatcher()
+        for pattern in patterns:
+            key = pattern.lower().strip()
+            if key in self.patterns:
+                matcher.patterns[key] = self.patterns[key]
+            else:
+                matcher.extend([key])
+        return matcher
+
+    def match(self, text_lower):
+        """Return the set of lowercased patterns found as whole words"""
+        found = set()
+        text_len = len(text_lower)
+        for pattern, (check_left, check_right) in self.patterns.items():
+            start = text_lower.find(pattern)
+            while start != -1:
+                end = start + len(pattern)
+                if ((not check_left or start == 0 or not _is_word_char(text_lower[start - 1])) and
+                        (not check_right or end == text_len or not _is_word_char(text_lower[end]))):
+                    found.add(pattern)
+                    break
+                start = text_lower.find(pattern, start + 1)
+        return found
+
+
+class JobProfile:
+    """Everything analyze_resume derives from one job description and industry.
+
+    Built once per (JD, industry) pair and shared by every resume scored
+    against it, so the JD regexes, phrase list and keyword scans run once.
+    """
+
+    def __init__(self, analyzer, job_description, industry, taxonomy=None):
+        taxonomy = taxonomy or analyzer.taxonomy
+        self.taxonomy = taxonomy
+        self.taxonomy_version = taxonomy.version
+        self.job_description = job_description
+        self.industry = industry
+        self.industry_skills = taxonomy.industry_skills.get(industry, taxonomy.industry_skills['technology'])
+        self.jd_skills = analyzer.extract_skills_from_job_description(job_description)
+        self.experience_level = analyzer.get_experience_level_from_jd(job_description)
+
+        self.required_skills = {
+            category: list(dict.fromkeys(self.jd_skills[category] + self.industry_skills.get(category, [])))
+            for category in SKILL_CATEGORIES
+        }
+        self.jd_skill_sets = {
+            category: {skill.lower() for skill in skills}
+            for category, skills in self.jd_skills.items()
+        }
+        # JD skills the load-time vocabulary does not know, e.g. "problem-solving"
+        self.jd_only_skills = {skill.lower() for skills in self.jd_skills.values() for skill in skills
+                               if skill not in taxonomy.skill_matcher}
+        # Only the skills this JD and industry can score need to be searched for
+        self.skill_matcher = taxonomy.skill_matcher.subset(
+            skill for skills in self.required_skills.values() for skill in skills
+        )
+
+        # Bit of each lowercased required skill in a resume's skill bitset: its interned taxonomy id,
+        # or an id past the vocabulary for JD-only skills
+        self.skill_bits = {}
+        next_id = len(taxonomy.skill_ids)
+        for skills in self.required_skills.values():
+            for skill in skills:
+                key = skill.lower()
+                if key not in self.skill_bits:
+                    skill_id = taxonomy.skill_ids.get(key)
+                    if skill_id is None:
+                        skill_id, next_id = next_id, next_id + 1
+                    self.skill_bits[key] = 1 << skill_id
+        # Entries are counted like the found-skill lists: 'python' and 'Python' are two entries of one bit
+        self.category_entries = {
+            category: [(skill, self.skill_bits[skill.lower()]) for skill in skills]
+            for category, skills in self.required_skills.items()
+        }
+        self.category_masks = {
+            category: sum(set(bit for _, bit in entries)) for category, entries in self.category_entries.items()
+        }
+        self.category_bit_counts = {
+            category: _bit_counts(bit for _, bit in entries) for category, entries in self.category_entries.items()
+        }
+        self.jd_match_bit_counts = _bit_counts(
+            bit for category, entries in self.category_entries.items() for skill, bit in entries
+            if skill.lower() in self.jd_skill_sets.get(category, ())
+        )
+        # Gap analysis checks the JD's skills and the industry's top five, in that order
+        self.gap_entries = {}
+        for category in SKILL_CATEGORIES:
+            candidates = dict.fromkeys(self.jd_skills.get(category, []))
+            candidates.update(dict.fromkeys(self.industry_skills.get(category, [])[:5]))
+            self.gap_entries[category] = [(skill, self.skill_bits[skill.lower()]) for skill in candidates]
+        self.gap_masks = {
+            category: sum(set(bit for _, bit in entries)) for category, entries in self.gap_entries.items()
+        }
+
+        # What each matched (lowercased) skill adds to the final score, for index-side scoring
+        self.skill_weights = {}
+        for category, skills in self.required_skills.items():
+            for skill in skills:
+                key = skill.lower()
+                weight = SKILL_CATEGORY_WEIGHTS[category]
+                if key in self.jd_skill_sets.get(category, ()):
+                    weight += JD_SKILL_MATCH_BONUS
+                self.skill_weights[key] = self.skill_weights.get(key, 0) + weight
+
+        self.jd_phrases = analyzer.extract_jd_phrases(job_description)
+        # Weight of each phrase in relevance: every repeat counts in the legacy substring mode
+        if analyzer.relevance_mode == 'substring':
+            self.relevance_phrase_weights = dict(Counter(self.jd_phrases))
+        else:
+            self.relevance_phrase_weights = dict.fromkeys(self.jd_phrases, 1)
+        self.relevance_total = sum(self.relevance_phrase_weights.values())
+        self.culture_keywords = analyzer.extract_culture_keywords(job_description)
+        self.salary_keyword_bonus = analyzer.get_salary_keyword_bonus(job_description)
+
+    def skill_mask(self, matched):
+        """Skill bitset of lowercased matched skills; skills this profile does not require are ignored"""
+        mask = 0
+        for skill in matched:
+            mask |= self.skill_bits.get(skill, 0)
+        return mask
+
+    def relevance_score(self, phrase_matches):
+        """JD relevance percentage of a resume that matches phrase_matches of relevance_total phrase weight"""
+        relevance_score = (phrase_matches / self.relevance_total * 100) if self.relevance_total > 0 else 0
+        return min(relevance_score, 100)
+
+    def count_skills(self, skills, category):
+        """Number of found-skill entries a skill bitset has in a category"""
+        return _count_entries(skills, self.category_bit_counts[category])
+
+    def found_skills(self, skills):
+        """Per-category found-skill lists of a skill bitset, in required-skill order"""
+        return {
+            category: [skill for skill, bit in entries if skills & bit]
+            for category, entries in self.category_entries.items()
+        }
+
+    def skill_gaps(self, skills):
+        """Per-category JD and top industry skills missing from a skill bitset"""
+        return {
+            category: [skill for skill, bit in entries if not skills & bit]
+            for category, entries in self.gap_entries.items()
+        }
+
+
+class ResumeResult:
+    """One scored resume, kept compact until it is serialized.
+
+    Found skills are a single bitset over the JobProfile's skill bits and
+    gap analysis is only a flag; ``to_dict`` expands both against the
+    shared profile into the JSON shape the API returns. Pickling leaves the
+    profile out, and the receiving process attaches its own.
+    """
+
+    __slots__ = ('profile', 'name', 'email', 'phone', 'extraction_mode', 'skills', 'score', 'relevance_score',
+                 'jd_skill_matches', 'skill_gaps', 'salary_estimate', 'culture_match', 'summary')
+    status = STATUS_OK
+
+    def __init__(self, profile, resume_data, skills, score, relevance_score, jd_skill_matches, skill_gaps=False,
+                 salary_estimate=None, culture_match=None):
+        self.profile = profile
+        self.name = resume_data['name']
+        self.email = resume_data['email']
+        self.phone = resume_data['phone']
+        self.extraction_mode = resume_data.get('extractionMode')
+        self.skills = skills
+        self.score = score
+        self.relevance_score = relevance_score
+        self.jd_skill_matches = jd_skill_matches
+        self.skill_gaps = skill_gaps
+        self.salary_estimate = salary_estimate
+        self.culture_match = culture_match
+        self.summary = None
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__[1:])
+
+    def __setstate__(self, state):
+        self.profile = None
+        for name, value in zip(self.__slots__[1:], state):
+            setattr(self, name, value)
+
+    def has_skills(self, category):
+        return bool(self.skills & self.profile.category_masks[category])
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'email': self.email,
+            'phone': self.phone,
+            'foundSkills': self.profile.found_skills(self.skills),
+            'score': self.score,
+            'relevanceScore': self.relevance_score,
+            'experienceLevel': self.profile.experience_level,
+            'jdSkillMatches': self.jd_skill_matches,
+            'gapAnalysis': self.profile.skill_gaps(self.skills) if self.skill_gaps else None,
+            'salaryEstimate': self.salary_estimate,
+            'cultureMatch': self.culture_match,
+            'extractionMode': self.extraction_mode,
+            'status': self.status,
+            'summary': self.summary
+        }
+
+
+class JobProfileCache:
+    """Bounded, thread-safe LRU of JobProfile objects with hit/miss counters"""
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+
+        # Build outside the lock so a slow JD does not block other requests
+        profile = factory()
+
+        with self._lock:
+            self._profiles[key] = profile
+            self._profiles.move_to_end(key)
+            while len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._profiles),
+                'maxSize': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+class MatrixScorer:
+    """Scores parsed resumes against several JobProfiles, doing each resume's JD-independent work once.
+
+    A resume is lowercased, searched for the union of every profile's
+    skills and, in 'ngram' mode, phrase-indexed a single time; each
+    (resume, JD) cell then only does set lookups. Cells go through
+    score_skill_matches, calculate_jd_relevance_score and final_score like
+    analyze_resume, so they equal what /analyze reports for that JD.
+    """
+
+    def __init__(self, analyzer, profiles):
+        self.analyzer = analyzer
+        self.profiles = profiles
+        self.skill_matcher = SkillMatcher.union(profile.skill_matcher for profile in profiles)
+
+    def score(self, resume_data):
+        """Return ([score per profile], [relevanceScore per profile]) for one parsed resume"""
+        content = resume_data['content']
+        # Skills of other profiles in the set are harmless: each profile's bitset only keeps its own
+        matched = self.skill_matcher.match(content.lower())
+        phrase_index = self.analyzer.build_phrase_index(content) if self.analyzer.relevance_mode == 'ngram' else None
+        
+        scores = []
+        relevance_scores = []
+        for profile in self.profiles:
+            jd_skill_matches, base_score = self.analyzer.score_skill_matches(profile.skill_mask(matched), profile)
+            relevance_score = self.analyzer.calculate_jd_relevance_score(content, profile, phrase_index)
+            scores.append(self.analyzer.final_score(base_score, jd_skill_matches, relevance_score))
+            relevance_scores.append(round(relevance_score, 1))
+        return scores, relevance_scores
+
+
+class IndustryDetector:
+    """Counts every industry's keywords in a text with one precompiled regex.
+
+    Keywords are escaped and lowercased. The alternation sits in a lookahead
+    and lists longer keywords first, so one scan yields the longest keyword
+    starting at each position. Shorter keywords that are prefixes of it
+    ("customer" in "customer service") are credited from a table built
+    here, so every keyword is still counted on its own, as a substring.
+    """
+
+    def __init__(self, industry_keywords):
+        self.industries = list(industry_keywords)
+        keywords = list(dict.fromkeys(
+            keyword.lower() for words in industry_keywords.values() for keyword in words if keyword
+        ))
+
+        # Which industries get a point when a keyword matches, counting duplicates across industries
+        owners = {keyword: Counter() for keyword in keywords}
+        for industry, words in industry_keywords.items():
+            for keyword in words:
+                if keyword:
+                    owners[keyword.lower()][industry] += 1
+
+        self.credits = {}
+        for keyword in keywords:
+            credit = Counter()
+            for other in keywords:
+                if keyword.startswith(other):
+                    credit.update(owners[other])
+            self.credits[keyword] = credit
+
+        ordered = sorted(keywords, key=len, reverse=True)
+        self.pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))') if ordered else None
+
+    def score(self, text):
+        """Keyword counts per industry, in keyword-table order"""
+        scores = dict.fromkeys(self.industries, 0)
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text.lower()):
+                for industry, count in self.credits[match.group(1)].items():
+                    scores[industry] += count
+        return scores
+
+    def rank(self, text):
+        """(industry, score) pairs for industries with any keyword hit, best first; ties keep table order"""
+        scores = self.score(text)
+        return sorted(((industry, score) for industry, score in scores.items() if score > 0),
+                      key=lambda item: item[1], reverse=True)
+
+
+class SkillTaxonomy:
+    """Immutable snapshot of skills.json and the matchers compiled from it.
+
+    The analyzer swaps whole snapshots, so a request that picked one up
+    keeps a consistent view of skills and keywords for its whole run.
+    ``version`` is a digest of the file bytes.
+    """
+
+    # Bump when SkillTaxonomy or the objects it holds change shape, so older snapshots are rebuilt
+    SNAPSHOT_FORMAT = 1
+
+    def __init__(self, data, version):
+        self.version = version
+        self.loaded_at = time.time()
+        self.industry_skills = data.get("industrySkills", {})
+        self.industry_keywords = data.get("industryKeywords", {})
+        if not isinstance(self.industry_skills, dict) or not isinstance(self.industry_keywords, dict):
+            raise ValueError("industrySkills and industryKeywords must be objects")
+        
+        self.industry_detector = IndustryDetector(self.industry_keywords)
+
+        # Every industry's skills share one matcher, so a resume is scanned once
+        self.skill_matcher = SkillMatcher(
+            skill
+            for skills in self.industry_skills.values()
+            for category_skills in skills.values()
+            for skill in category_skills
+        )
+        # Skills are interned to small ids here; JobProfile turns them into skill bitset positions
+        self.skill_ids = {skill: skill_id for skill_id, skill in enumerate(self.skill_matcher.patterns)}
+
+    @staticmethod
+    def version_of(raw):
+        return hashlib.sha256(raw).hexdigest()[:12]
+
+    @classmethod
+    def from_bytes(cls, raw):
+        return cls(json.loads(raw.decode('utf-8')), cls.version_of(raw))
+
+    def save_snapshot(self, path):
+        """Pickle this taxonomy to ``path``, replacing it atomically; errors are logged, not raised"""
+        directory = os.path.dirname(path) or '.'
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.skills-snapshot-')
+        except OSError as e:
+            logger.warning(f"Could not write skills snapshot {path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # The header is a pickle of its own, so a stale snapshot is rejected before the rest is read
+                pickle.dump((self.SNAPSHOT_FORMAT, self.version), f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write skills snapshot {path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def load_snapshot(cls, path, version):
+        """Taxonomy saved by save_snapshot for skills.json bytes of ``version``, or None if there is none"""
+        try:
+            with open(path, 'rb') as f:
+                if pickle.load(f) != (cls.SNAPSHOT_FORMAT, version):
+                    return None
+                taxonomy = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Also covers snapshots pickled under another module name, e.g. by `python app.py`
+            logger.warning(f"Ignoring unreadable skills snapshot {path}: {e}")
+            return None
+        if not isinstance(taxonomy, cls):
+            return None
+        taxonomy.loaded_at = time.time()
+        return taxonomy
+
+
 class ResumeAnalyzer:
 
-    def __init__(self, skills_file="skills.json"):
+    def __init__(self, skills_file="skills.json", profile_cache_size=64, text_cache=None, relevance_mode='ngram',
+                 metrics=None, fast_pdf_max_pages=10, fast_pdf_max_chars=100000, extraction_sandbox=None,
+                 taxonomy_snapshot=None, taxonomy=None):
+        if relevance_mode not in RELEVANCE_MODES:
+            raise ValueError(f"Unknown relevance mode: {relevance_mode}")
         self.skills_file = skills_file
-        self.load_industry_data()
+        self.relevance_mode = relevance_mode
+        self.fast_pdf_max_pages = fast_pdf_max_pages
+        self.fast_pdf_max_chars = fast_pdf_max_chars
+        self.metrics = metrics if metrics is not None else Metrics(enabled=False)
+        self.profile_cache = JobProfileCache(profile_cache_size)
+        self.text_cache = text_cache
+        self.extraction_sandbox = extraction_sandbox
+        self.taxonomy_snapshot = taxonomy_snapshot
+        self._reload_lock = threading.Lock()
+        if taxonomy is not None:
+            # Compiled elsewhere, e.g. handed to a pool worker by the parent process
+            self.taxonomy = taxonomy
+        else:
+            self.load_industry_data()
     
     def load_industry_data(self):
         if not os.path.exists(self.skills_file):
             raise FileNotFoundError(f"{self.skills_file} not found")
-        with open(self.skills_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.industry_skills = data.get("industrySkills", {})
-            self.industry_keywords = data.get("industryKeywords", {})
+        with open(self.skills_file, "rb") as f:
+            self.taxonomy = self.compile_taxonomy(f.read())
+        # Profiles embed industry skills and the matcher, so drop stale ones
+        self.profile_cache.clear()
+    
+    def compile_taxonomy(self, raw):
+        """SkillTaxonomy of skills.json bytes, read from the taxonomy snapshot when it was built from the same bytes"""
+        if not self.taxonomy_snapshot:
+            return SkillTaxonomy.from_bytes(raw)
+        taxonomy = SkillTaxonomy.load_snapshot(self.taxonomy_snapshot, SkillTaxonomy.version_of(raw))
+        if taxonomy is None:
+            taxonomy = SkillTaxonomy.from_bytes(raw)
+            taxonomy.save_snapshot(self.taxonomy_snapshot)
+        return taxonomy
+    
+    def reload_industry_data(self, force=False):
+        """Rebuild the taxonomy if skills.json changed and swap it in; returns True when swapped.
+        
+        The new snapshot is compiled before the single attribute swap, so
+        requests already running finish on the old one. An unreadable or
+        invalid file leaves the current snapshot in place and raises.
+        """
+        with self._reload_lock:
+            with open(self.skills_file, "rb") as f:
+                raw = f.read()
+            if not force and SkillTaxonomy.version_of(raw) == self.taxonomy.version:
+                return False
+            
+            taxonomy = SkillTaxonomy.from_bytes(raw) if force else self.compile_taxonomy(raw)
+            previous = self.taxonomy.version
+            self.taxonomy = taxonomy
+            self.profile_cache.clear()
+        logger.info(f"Reloaded {self.skills_file}: taxonomy {previous} -> {taxonomy.version}")
+        return True
+    
+    @property
+    def taxonomy_version(self):
+        return self.taxonomy.version
+    
+    @property
+    def industry_skills(self):
+        return self.taxonomy.industry_skills
+    
+    @property
+    def industry_keywords(self):
+        return self.taxonomy.industry_keywords
+    
+    @property
+    def skill_matcher(self):
+        return self.taxonomy.skill_matcher
+    
+    @property
+    def industry_detector(self):
+        return self.taxonomy.industry_detector
+
+    def get_job_profile(self, job_description, industry, taxonomy=None):
+        """Return the cached JobProfile for a JD and industry, building it on a miss.
+
+        Keyed on the exact JD text: line breaks and spacing change which
+        multi-word phrases the JD regexes see, so two JDs that differ only
+        in whitespace may not score the same.
+        """
+        taxonomy = taxonomy or self.taxonomy
+        key = hashlib.sha256(f"{taxonomy.version}\0{industry}\0{job_description}".encode('utf-8')).hexdigest()
+        return self.profile_cache.get_or_create(key, lambda: JobProfile(self, job_description, industry, taxonomy))
     
     def extract_skills_from_job_description(self, job_description):
         jd_lower = job_description.lower()
@@ -78,9 +786,9 @@ class ResumeAnalyzer:
             matches = re.findall(pattern, jd_lower, re.IGNORECASE)
             extracted_skills['certifications'].extend(matches)
         
-        # Remove duplicates and clean up
+        # Remove duplicates and clean up, keeping first-seen order
         for category in extracted_skills:
-            extracted_skills[category] = list(set(extracted_skills[category]))
+            extracted_skills[category] = list(dict.fromkeys(extracted_skills[category]))
         
         return extracted_skills
     
@@ -110,33 +818,57 @@ class ResumeAnalyzer:
         
         return list(set(keywords))
     
-    def calculate_jd_relevance_score(self, resume_content, job_description):
-        """Calculate how relevant the resume is to the specific job description"""
-        resume_lower = resume_content.lower()
-        jd_lower = job_description.lower()
-        
-        jd_phrases = []
-        words = re.findall(r'\b\w+\b', jd_lower)
+    def extract_phrases(self, text_lower):
+        """Word bigrams and trigrams of a lowercased text, in order and with repeats"""
+        phrases = []
+        words = re.findall(r'\b\w+\b', text_lower)
         
         for i in range(len(words) - 1):
             phrase = f"{words[i]} {words[i+1]}"
             if len(phrase) > 6:
-                jd_phrases.append(phrase)
+                phrases.append(phrase)
         
         for i in range(len(words) - 2):
             phrase = f"{words[i]} {words[i+1]} {words[i+2]}"
             if len(phrase) > 10:
-                jd_phrases.append(phrase)
+                phrases.append(phrase)
         
-        phrase_matches = 0
-        for phrase in jd_phrases:
-            if phrase in resume_lower:
-                phrase_matches += 1
-        
-        total_phrases = len(jd_phrases)
-        relevance_score = (phrase_matches / total_phrases * 100) if total_phrases > 0 else 0
+        return phrases
+    
+    def extract_jd_phrases(self, job_description):
+        """Bigrams and trigrams of the job description used for relevance scoring"""
+        return self.extract_phrases(job_description.lower())
+    
+    def build_phrase_index(self, resume_content):
+        """Hashed set of every word bigram and trigram of a resume, built once per resume.
+        
+        No length filter is applied here: JD phrases are already filtered,
+        so a short resume phrase simply never matches one.
+        """
+        words = re.findall(r'\b\w+\b', resume_content.lower())
+        phrase_index = set(map(' '.join, zip(words, words[1:])))
+        phrase_index.update(map(' '.join, zip(words, words[1:], words[2:])))
+        return phrase_index
+    
+    def calculate_jd_relevance_score(self, resume_content, profile, phrase_index=None):
+        """Calculate how relevant the resume is to the profile's job description.
+        
+        In the default 'ngram' mode each distinct JD phrase is looked up in
+        the resume's phrase index; 'substring' mode keeps the legacy scoring,
+        scanning the resume once per phrase and counting repeated phrases.
+        Both weigh phrases by the profile's relevance_phrase_weights, as the
+        candidate index does.
+        """
+        phrase_weights = profile.relevance_phrase_weights
+        if self.relevance_mode == 'substring':
+            resume_lower = resume_content.lower()
+            phrase_matches = sum(weight for phrase, weight in phrase_weights.items() if phrase in resume_lower)
+        else:
+            if phrase_index is None:
+                phrase_index = self.build_phrase_index(resume_content)
+            phrase_matches = sum(phrase_weights[phrase] for phrase in phrase_index.intersection(phrase_weights))
         
-        return min(relevance_score, 100) 
+        return profile.relevance_score(phrase_matches)
     
     def get_experience_level_from_jd(self, job_description):
         """Extract experience level requirements from job description"""
@@ -170,23 +902,14 @@ class ResumeAnalyzer:
         
         return 2 
     
+    def rank_industries(self, job_description):
+        """Candidate industries for a job description with their keyword scores, best first"""
+        return self.industry_detector.rank(job_description)
+    
     def detect_industry(self, job_description):
         """Auto-detect industry based on job description keywords"""
-        text = job_description.lower()
-        max_score = 0
-        detected_industry = 'technology' 
-        
-        for industry, keywords in self.industry_keywords.items():
-            score = 0
-            for keyword in keywords:
-                matches = len(re.findall(keyword, text, re.IGNORECASE))
-                score += matches
-            
-            if score > max_score:
-                max_score = score
-                detected_industry = industry
-        
-        return detected_industry
+        ranked = self.rank_industries(job_description)
+        return ranked[0][0] if ranked else 'technology'
     
     def clean_text(self, text):
         """Strip extra whitespace, control characters, and artifacts"""
@@ -225,65 +948,165 @@ class ResumeAnalyzer:
 
         return mobile_num
 
-    def extract_text_from_pdf(self, file_path):
-        """Accurate text extraction from PDF using pdfplumber"""
-        try:
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting PDF text: {e}")
-            return ""
+    def extract_text_from_pdf(self, source, mode='accurate'):
+        """Text extraction from PDF; source is a path, bytes or stream.
+        
+        'accurate' runs pdfplumber's layout-aware extraction on every page.
+        'fast' reads layout-free text with pdfium (pdfplumber's simple
+        extraction without it) and stops after ``fast_pdf_max_pages`` pages
+        or ``fast_pdf_max_chars`` characters.
+        """
+        return self.extract_text_by_type(source, 'pdf', mode)
     
-    def extract_text_from_docx(self, file_path):
-        """Extract text from DOCX file"""
-        try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting DOCX text: {e}")
-            return ""
+    def _read_pdf_text(self, source, mode):
+        if mode == 'fast':
+            return self._read_pdf_text_fast(source)
+        
+        pages = []
+        with _pdfplumber().open(_as_binary_source(source)) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    pages.append(page_text + "\n")
+        return "".join(pages)
     
-    def extract_text_from_txt(self, file_path):
-        """Extract text from TXT file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
+    def _read_pdf_text_fast(self, source):
+        pages = []
+        remaining = self.fast_pdf_max_chars
+        
+        def add(page_text):
+            nonlocal remaining
+            page_text = page_text[:remaining]
+            remaining -= len(page_text)
+            if page_text:
+                pages.append(page_text + "\n")
+        
+        pdfium = _pdfium()
+        if pdfium is not None:
+            document = pdfium.PdfDocument(_read_source_bytes(source))
+            try:
+                for index in range(min(len(document), self.fast_pdf_max_pages)):
+                    if remaining <= 0:
+                        break
+                    page = document[index]
+                    text_page = page.get_textpage()
+                    add(text_page.get_text_range())
+                    text_page.close()
+                    page.close()
+            finally:
+                document.close()
+        else:
+            with _pdfplumber().open(_as_binary_source(source)) as pdf:
+                for page in pdf.pages[:self.fast_pdf_max_pages]:
+                    if remaining <= 0:
+                        break
+                    add(page.extract_text_simple() or "")
+        return "".join(pages)
+    
+    def extract_text_from_docx(self, source):
+        """Extract text from DOCX file; source is a path, bytes or stream"""
+        return self.extract_text_by_type(source, 'docx')
+    
+    def _read_docx_text(self, source):
+        # Streams the XML parts instead of loading python-docx's object model; adds tables, text boxes,
+        # headers and footers to what paragraph-only extraction returned
+        return read_docx_text(_as_binary_source(source))
+    
+    def extract_text_from_txt(self, source):
+        """Extract text from TXT file; source is a path, bytes or stream"""
+        return self.extract_text_by_type(source, 'txt')
+    
+    def _read_txt_text(self, source):
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8') as file:
                 return file.read()
-        except Exception as e:
-            logger.error(f"Error extracting TXT text: {e}")
-            return ""
+        data = source if isinstance(source, (bytes, bytearray, memoryview)) else source.read()
+        return bytes(data).decode('utf-8')
     
-    def extract_text_from_file(self, file_path, filename):
-        """Extract text from uploaded file based on its type"""
+    def extraction_mode_for(self, filename, mode):
+        """The mode an extractor actually applies to a file when ``mode`` is requested"""
         file_ext = filename.lower().split('.')[-1]
-        
+        return mode if file_ext in FAST_EXTRACTION_TYPES else 'accurate'
+    
+    def extract_text_from_file(self, source, filename, mode='accurate'):
+        """Extract text from uploaded file, served from the text cache when the same bytes were seen before"""
+        return self.extract_text_with_status(source, filename, mode)[0]
+    
+    def extract_text_with_status(self, source, filename, mode='accurate'):
+        """Like extract_text_from_file, but returns (text, status, error); see run_extractor"""
+        file_ext = filename.lower().split('.')[-1]
+        mode = self.extraction_mode_for(filename, mode)
+        
+        if self.text_cache is None or file_ext not in CACHED_FILE_TYPES:
+            return self.run_extractor(source, file_ext, mode)
+        
+        data = _read_source_bytes(source)
+        # Fast text depends on the caps, so it is cached apart from accurate text
+        kind = file_ext if mode == 'accurate' else f"{file_ext}:{mode}:{self.fast_pdf_max_pages}:{self.fast_pdf_max_chars}"
+        key = self.text_cache.make_key(data, kind)
+        text = self.text_cache.get(key)
+        if text is not None:
+            return text, STATUS_OK, None
+        
+        text, status, error = self.run_extractor(data, file_ext, mode)
+        # Empty text may be a transient failure, so it is not remembered
+        if status == STATUS_OK and text.strip():
+            self.text_cache.put(key, text)
+        return text, status, error
+    
+    def extract_text_by_type(self, source, file_ext, mode='accurate'):
+        """Extract text from a file based on its type"""
+        return self.run_extractor(source, file_ext, mode)[0]
+    
+    def read_text_by_type(self, source, file_ext, mode='accurate'):
+        """Extract text from a file based on its type, letting extractor errors propagate"""
         if file_ext == 'pdf':
-            return self.extract_text_from_pdf(file_path)
+            return self._read_pdf_text(source, mode)
         elif file_ext == 'docx':
-            return self.extract_text_from_docx(file_path)
+            return self._read_docx_text(source)
         elif file_ext == 'txt':
-            return self.extract_text_from_txt(file_path)
+            return self._read_txt_text(source)
         else:
             return ""
     
+    def run_extractor(self, source, file_ext, mode='accurate'):
+        """Extract text by type; returns (text, status, error) where status is 'ok', 'timeout', 'oom' or 'parse_error'.
+        
+        With an extraction sandbox, PDF and DOCX files are parsed in its
+        child processes, so a file that hangs or exhausts memory is cut off
+        at the sandbox limits instead of holding up the caller.
+        """
+        if file_ext not in RESUME_FILE_TYPES:
+            return "", STATUS_OK, None
+        
+        with self.metrics.stage(f'extract_{file_ext}' if mode == 'accurate' else f'extract_{file_ext}_{mode}'):
+            if self.extraction_sandbox is not None and file_ext in SANDBOXED_FILE_TYPES:
+                text, status, error = self.extraction_sandbox.extract(_read_source_bytes(source), file_ext, mode)
+            else:
+                try:
+                    text, status, error = self.read_text_by_type(source, file_ext, mode), STATUS_OK, None
+                except MemoryError:
+                    text, status, error = "", STATUS_OOM, 'Out of memory'
+                except Exception as e:
+                    text, status, error = "", STATUS_PARSE_ERROR, str(e) or type(e).__name__
+        
+        if status != STATUS_OK:
+            logger.error(f"Error extracting {file_ext.upper()} text ({status}): {error}")
+            self.metrics.inc('extraction_failures', 1, file_ext, status)
+        return text, status, error
+    
     def parse_resume_content(self, content, filename):
         """Parse resume content to extract email and phone"""
-        cleaned_content = self.clean_text(content)
+        with self.metrics.stage('parse'):
+            cleaned_content = self.clean_text(content)
 
-        email_match = re.search(EMAIL_REGEX, cleaned_content)
-        email = email_match.group(0) if email_match else 'Not found'
+            email_match = re.search(EMAIL_REGEX, cleaned_content)
+            email = email_match.group(0) if email_match else 'Not found'
 
-        phone_match = re.search(PHONE_REGEX, cleaned_content)
-        raw_phone = phone_match.group(0) if phone_match else ''
+            phone_match = re.search(PHONE_REGEX, cleaned_content)
+            raw_phone = phone_match.group(0) if phone_match else ''
 
-        phone = self.clean_phone_number(raw_phone)
+            phone = self.clean_phone_number(raw_phone)
 
         return {
             'name': filename,
@@ -292,26 +1115,16 @@ class ResumeAnalyzer:
             'phone': phone
         }
     
-    def identify_skill_gaps(self, found_skills, jd_skills, industry_skills):
-        """Identify missing skills based on both JD and industry requirements"""
-        gaps = {}
-        
-        for category in ['technical', 'soft', 'certifications']:
-            required_skills = set()
-            
-            if category in jd_skills:
-                required_skills.update(jd_skills[category])
-            
-            if category in industry_skills:
-                required_skills.update(industry_skills[category][:5]) 
-            
-            found_set = set([skill.lower() for skill in found_skills.get(category, [])])
-            gaps[category] = [skill for skill in required_skills 
-                            if skill.lower() not in found_set]
-        
-        return gaps
+    def identify_skill_gaps(self, skills, profile):
+        """Identify missing skills based on both JD and industry requirements, for a skill bitset"""
+        return profile.skill_gaps(skills)
+    
+    def get_salary_keyword_bonus(self, job_description):
+        """Salary bonus for high-value keywords mentioned in the JD"""
+        jd_lower = job_description.lower()
+        return sum(5000 for keyword in HIGH_VALUE_KEYWORDS if keyword in jd_lower)
     
-    def estimate_salary_based_on_jd(self, found_skills, job_description, experience_level):
+    def estimate_salary_based_on_jd(self, skill_counts, job_description, experience_level, keyword_bonus=None):
         """Estimate salary based on skills and JD context"""
         base = 25000 
         
@@ -323,37 +1136,27 @@ class ResumeAnalyzer:
             5: 2.0   
         }.get(experience_level, 1.0)
         
-        tech_bonus = len(found_skills.get('technical', [])) * 2000
-        cert_bonus = len(found_skills.get('certifications', [])) * 3000
-        soft_bonus = len(found_skills.get('soft', [])) * 500
+        tech_bonus = skill_counts.get('technical', 0) * 2000
+        cert_bonus = skill_counts.get('certifications', 0) * 3000
+        soft_bonus = skill_counts.get('soft', 0) * 500
         
-        jd_lower = job_description.lower()
-        high_value_keywords = [
-            'machine learning', 'ai', 'blockchain', 'cloud architect',
-            'devops', 'security', 'data scientist', 'full stack',
-            'lead', 'senior', 'principal', 'architect'
-        ]
-        
-        keyword_bonus = sum(5000 for keyword in high_value_keywords if keyword in jd_lower)
+        if keyword_bonus is None:
+            keyword_bonus = self.get_salary_keyword_bonus(job_description)
         
         total_salary = (base + tech_bonus + cert_bonus + soft_bonus + keyword_bonus) * exp_multiplier
         
         return f"₱{int(total_salary):,}"
     
-    def estimate_culture_fit(self, content, job_description):
+    def extract_culture_keywords(self, job_description):
+        """Culture keywords mentioned in the JD, with repeats"""
+        return re.findall(CULTURE_KEYWORD_REGEX, job_description.lower())
+    
+    def estimate_culture_fit(self, content, job_description, jd_culture_keywords=None):
         """Enhanced culture fit based on both resume and JD"""
-        jd_culture_keywords = re.findall(
-            r'\b(?:culture|values|team|collaboration|innovation|growth|learning|flexibility|remote|work-life|balance|diversity|inclusion)\b',
-            job_description.lower()
-        )
+        if jd_culture_keywords is None:
+            jd_culture_keywords = self.extract_culture_keywords(job_description)
         
-        standard_traits = [
-            'team', 'collaborate', 'integrity', 'respect',
-            'growth', 'learning', 'flexibility', 'balance',
-            'ownership', 'transparency', 'innovation', 'communication'
-        ]
-        
-        all_traits = list(set(jd_culture_keywords + standard_traits))
+        all_traits = list(set(jd_culture_keywords + STANDARD_CULTURE_TRAITS))
         
         content_lower = content.lower()
         matches = sum(1 for trait in all_traits if trait in content_lower)
@@ -366,19 +1169,16 @@ class ResumeAnalyzer:
         return f"{(weighted_score * 100):.0f}% Match"
     
     def generate_summary(self, resume_result, job_description):
-        """Generate enhanced analysis summary"""
-        found_skills = resume_result['foundSkills']
-        gap_analysis = resume_result.get('gapAnalysis')
-        score = resume_result['score']
-        relevance_score = resume_result.get('relevanceScore', 0)
-        salary_estimate = resume_result.get('salaryEstimate')
-        culture_match = resume_result.get('cultureMatch')
-        
-        total_matched = (len(found_skills.get('technical', [])) + 
-                        len(found_skills.get('soft', [])) + 
-                        len(found_skills.get('certifications', [])))
-        
-        if total_matched == 0:
+        """Generate enhanced analysis summary for a ResumeResult"""
+        profile = resume_result.profile
+        skills = resume_result.skills
+        score = resume_result.score
+        relevance_score = resume_result.relevance_score
+        salary_estimate = resume_result.salary_estimate
+        culture_match = resume_result.culture_match
+        
+        # The bitset only holds required skills, so any bit is a found skill
+        if not skills:
             return "This resume doesn't match the job requirements. Consider adding relevant technical and soft skills mentioned in the job description."
         
         summary = f"This resume shows a relevance score of {relevance_score:.1f}% to the job description "
@@ -391,11 +1191,8 @@ class ResumeAnalyzer:
         else:
             summary += "Limited alignment with specific job requirements. "
         
-        if gap_analysis and any(len(gaps) > 0 for gaps in gap_analysis.values()):
-            critical_gaps = [category for category, gaps in gap_analysis.items() 
-                           if len(gaps) > 0 and category == 'technical']
-            if critical_gaps:
-                summary += "Critical technical skill gaps identified. "
+        if resume_result.skill_gaps and profile.gap_masks['technical'] & ~skills:
+            summary += "Critical technical skill gaps identified. "
         
         if salary_estimate:
             summary += f"Estimated salary range: {salary_estimate}. "
@@ -405,76 +1202,640 @@ class ResumeAnalyzer:
         
         return summary
     
-    def analyze_resume(self, resume_data, industry, job_description, options):
+    def match_skills(self, content_lower, profile):
+        """Skill bitset of the required skills of a JobProfile that occur in a lowercased resume"""
+        return profile.skill_mask(profile.skill_matcher.match(content_lower))
+    
+    def score_skill_matches(self, skills, profile):
+        """JD skill matches and base score for a skill bitset, counted over the found-skill entries"""
+        jd_skill_matches = _count_entries(skills, profile.jd_match_bit_counts)
+        base_score = sum(profile.count_skills(skills, category) * SKILL_CATEGORY_WEIGHTS[category]
+                         for category in SKILL_CATEGORIES)
+        return jd_skill_matches, base_score
+    
+    def analyze_resume(self, resume_data, industry, job_description, options, profile=None):
         """Enhanced resume analysis with job description dependency"""
-        industry_skills = self.industry_skills.get(industry, self.industry_skills['technology'])
-        
-        jd_skills = self.extract_skills_from_job_description(job_description)
+        if profile is None:
+            profile = self.get_job_profile(job_description, industry)
         
-        experience_level = self.get_experience_level_from_jd(job_description)
+        with self.metrics.stage('skill_match'):
+            skills = self.match_skills(resume_data['content'].lower(), profile)
+            jd_skill_matches, base_score = self.score_skill_matches(skills, profile)
         
-        all_required_skills = {
-            'technical': list(set(jd_skills['technical'] + industry_skills.get('technical', []))),
-            'soft': list(set(jd_skills['soft'] + industry_skills.get('soft', []))),
-            'certifications': list(set(jd_skills['certifications'] + industry_skills.get('certifications', [])))
-        }
-        
-        found_skills = {
-            'technical': [],
-            'soft': [],
-            'certifications': []
-        }
+        with self.metrics.stage('relevance'):
+            relevance_score = self.calculate_jd_relevance_score(resume_data['content'], profile)
         
-        content_lower = resume_data['content'].lower()
-        
-        for category, skill_list in all_required_skills.items():
-            for skill in skill_list:
-                if skill.lower() in content_lower:
-                    found_skills[category].append(skill)
-        
-        jd_skill_matches = 0
-        for category in found_skills:
-            for skill in found_skills[category]:
-                if skill.lower() in [s.lower() for s in jd_skills.get(category, [])]:
-                    jd_skill_matches += 1
-        
-        base_score = (len(found_skills['technical']) * 2 + 
-                     len(found_skills['soft']) + 
-                     len(found_skills['certifications']) * 1.5)
-        
-        relevance_score = self.calculate_jd_relevance_score(resume_data['content'], job_description)
-        jd_bonus = (jd_skill_matches * 3) + (relevance_score / 10)
-        
-        final_score = base_score + jd_bonus
-        
-        # Optional analyses
-        gap_analysis = self.identify_skill_gaps(found_skills, jd_skills, industry_skills) if options.get('skillGaps') else None
-        salary_estimate = self.estimate_salary_based_on_jd(found_skills, job_description, experience_level) if options.get('salaryInsights') else None
-        culture_match = self.estimate_culture_fit(resume_data['content'], job_description) if options.get('cultureFit') else None
-        
-        result = {
-            'name': resume_data['name'],
-            'email': resume_data['email'],
-            'phone': resume_data['phone'],
-            'foundSkills': found_skills,
-            'score': round(final_score, 1),
-            'relevanceScore': round(relevance_score, 1),
-            'experienceLevel': experience_level,
-            'jdSkillMatches': jd_skill_matches,
-            'gapAnalysis': gap_analysis,
-            'salaryEstimate': salary_estimate,
-            'cultureMatch': culture_match
-        }
-        
-        result['summary'] = self.generate_summary(result, job_description)
+        return self.build_result(resume_data, profile, options, skills, jd_skill_matches,
+                                 self.final_score(base_score, jd_skill_matches, relevance_score),
+                                 round(relevance_score, 1))
+    
+    def final_score(self, base_score, jd_skill_matches, relevance_score):
+        """Reported score: skill base score plus the JD skill-match and relevance bonus"""
+        jd_bonus = (jd_skill_matches * JD_SKILL_MATCH_BONUS) + (relevance_score / 10)
+        return round(base_score + jd_bonus, 1)
+    
+    def build_result(self, resume_data, profile, options, skills, jd_skill_matches, score, relevance_score):
+        """Assemble a ResumeResult from computed scores, running the optional analyses"""
+        job_description = profile.job_description
+        
+        # Optional analyses; gaps are derived from the skill bitset when the result is serialized
+        salary_estimate = culture_match = None
+        if options.get('salaryInsights'):
+            with self.metrics.stage('salary'):
+                skill_counts = {category: profile.count_skills(skills, category) for category in SKILL_CATEGORIES}
+                salary_estimate = self.estimate_salary_based_on_jd(skill_counts, job_description, profile.experience_level, profile.salary_keyword_bonus)
+        if options.get('cultureFit'):
+            with self.metrics.stage('culture_fit'):
+                culture_match = self.estimate_culture_fit(resume_data['content'], job_description, profile.culture_keywords)
+        
+        result = ResumeResult(profile, resume_data, skills, score, relevance_score, jd_skill_matches,
+                              bool(options.get('skillGaps')), salary_estimate, culture_match)
+        
+        with self.metrics.stage('summary'):
+            result.summary = self.generate_summary(result, job_description)
         
         return result
 
-analyzer = ResumeAnalyzer()
+metrics = Metrics(enabled=app.config['METRICS_ENABLED'])
+# Built by create_app, so importing this module (scan.py, worker processes, tests) stays cheap
+analyzer = None
+archive_reader = None
+job_manager = None
+_services_lock = threading.Lock()
+
+_candidate_index = None
+_candidate_index_lock = threading.Lock()
+
+def watch_skills_file(resume_analyzer, interval):
+    """Daemon thread that reloads the taxonomy whenever skills.json's size or mtime changes"""
+    def poll():
+        last_seen = None
+        while True:
+            try:
+                stat = os.stat(resume_analyzer.skills_file)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if last_seen is not None and signature != last_seen:
+                    resume_analyzer.reload_industry_data()
+                last_seen = signature
+            except Exception as e:
+                logger.error(f"Error reloading {resume_analyzer.skills_file}: {e}")
+            time.sleep(interval)
+    
+    thread = threading.Thread(target=poll, name='skills-watcher', daemon=True)
+    thread.start()
+    return thread
+
+def create_app():
+    """Build the analyzer and the services behind the routes, once per process, and return the app.
+
+    Importing this module only sets up configuration and routes. WSGI
+    servers should load ``app:create_app()`` (with gunicorn's --preload the
+    workers then fork with everything built); the module-level ``app``
+    builds the services on its first request instead, which then carries
+    the start-up cost.
+    """
+    global analyzer, archive_reader, job_manager
+    with _services_lock:
+        if analyzer is not None:
+            return app
+        
+        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+        resume_analyzer = ResumeAnalyzer(
+            text_cache=create_text_cache(app.config['TEXT_CACHE_PATH'], app.config['TEXT_CACHE_MAX_BYTES']),
+            relevance_mode=app.config['RELEVANCE_MODE'],
+            metrics=metrics,
+            fast_pdf_max_pages=app.config['FAST_PDF_MAX_PAGES'],
+            fast_pdf_max_chars=app.config['FAST_PDF_MAX_CHARS'],
+            taxonomy_snapshot=app.config['SKILLS_SNAPSHOT_PATH']
+        )
+        resume_analyzer.extraction_sandbox = create_extraction_sandbox(resume_analyzer, app.config['EXTRACTION_WORKERS'])
+        archive_reader = ArchiveReader(
+            RESUME_FILE_TYPES,
+            max_members=app.config['ARCHIVE_MAX_MEMBERS'],
+            max_total_bytes=app.config['ARCHIVE_MAX_BYTES'],
+            max_member_bytes=app.config['ARCHIVE_MAX_MEMBER_BYTES']
+        )
+        job_manager = JobManager(max_workers=app.config['JOB_WORKERS'], ttl=app.config['JOB_RESULT_TTL'])
+        if app.config['SKILLS_RELOAD_INTERVAL'] > 0:
+            watch_skills_file(resume_analyzer, app.config['SKILLS_RELOAD_INTERVAL'])
+        # Set last: ensure_services checks it without taking the lock
+        analyzer = resume_analyzer
+    return app
+
+@app.before_request
+def ensure_services():
+    if analyzer is None:
+        create_app()
+
+def get_candidate_index():
+    """Open the candidate index on first use so plain /analyze deployments never create it"""
+    global _candidate_index
+    with _candidate_index_lock:
+        if _candidate_index is None:
+            _candidate_index = CandidateIndex(app.config['CANDIDATE_INDEX_PATH'])
+        return _candidate_index
+
+def extract_resume(resume_analyzer, source, filename, extraction_mode='accurate'):
+    """Extract and parse one upload; returns (resume_data, status, error), resume_data being None unless status is 'ok'"""
+    try:
+        content, status, error = resume_analyzer.extract_text_with_status(source, filename, extraction_mode)
+        resume_analyzer.metrics.inc('files_processed')
+        if status != STATUS_OK:
+            return None, status, error
+        
+        if not content.strip():
+            logger.warning(f"No text extracted from {filename}")
+            resume_analyzer.metrics.inc('empty_text')
+            return None, STATUS_EMPTY, 'No text could be extracted'
+        
+        resume_data = resume_analyzer.parse_resume_content(content, filename)
+        resume_data['extractionMode'] = resume_analyzer.extraction_mode_for(filename, extraction_mode)
+        return resume_data, STATUS_OK, None
+    
+    except Exception as e:
+        logger.error(f"Error processing {filename}: {e}")
+        return None, STATUS_PARSE_ERROR, str(e) or type(e).__name__
+
+def failed_file(resume_analyzer, filename, status, error, extraction_mode='accurate'):
+    """Record reported in place of a result for a file that could not be scored"""
+    return {
+        'name': filename,
+        'status': status,
+        'error': error,
+        'extractionMode': resume_analyzer.extraction_mode_for(filename, extraction_mode)
+    }
+
+def process_resume_file(resume_analyzer, source, filename, industry, job_description, options, profile=None):
+    """Extract, parse and score one upload; returns its ResumeResult, or a failed_file record whose status says why not"""
+    extraction_mode = options.get('extractionMode', 'accurate')
+    resume_data, status, error = extract_resume(resume_analyzer, source, filename, extraction_mode)
+    if resume_data is None:
+        return failed_file(resume_analyzer, filename, status, error, extraction_mode)
+    return score_resume(resume_analyzer, resume_data, industry, job_description, options, profile)
+
+def score_resume(resume_analyzer, resume_data, industry, job_description, options, profile=None):
+    """Score parsed resume data; returns its ResumeResult, or a failed_file record if scoring raised"""
+    try:
+        return resume_analyzer.analyze_resume(resume_data, industry, job_description, options, profile)
+    except Exception as e:
+        logger.error(f"Error processing {resume_data['name']}: {e}")
+        return failed_file(resume_analyzer, resume_data['name'], STATUS_ERROR, str(e) or type(e).__name__,
+                           options.get('extractionMode', 'accurate'))
+
+_worker_analyzer = None
+# Taxonomies a worker can score against, by version: the one it started on first, then any shipped with tasks
+_worker_taxonomies = {}
+_process_pool = None
+_process_pool_taxonomy_version = None
+_process_pool_lock = threading.Lock()
+
+def _init_worker(skills_file, taxonomy, text_cache_path, text_cache_max_bytes, relevance_mode,
+                 fast_pdf_max_pages, fast_pdf_max_chars):
+    """Build the worker's analyzer once per process around the parent's compiled taxonomy"""
+    global _worker_analyzer
+    _worker_analyzer = ResumeAnalyzer(
+        skills_file,
+        text_cache=create_text_cache(text_cache_path, text_cache_max_bytes),
+        relevance_mode=relevance_mode,
+        fast_pdf_max_pages=fast_pdf_max_pages,
+        fast_pdf_max_chars=fast_pdf_max_chars,
+        taxonomy=taxonomy
+    )
+    _worker_taxonomies[taxonomy.version] = taxonomy
+    # Each worker scores one file at a time, so one extraction child is enough
+    _worker_analyzer.extraction_sandbox = create_extraction_sandbox(_worker_analyzer, 1)
+
+@lru_cache(maxsize=2)
+def taxonomy_payload(taxonomy):
+    """Pickled taxonomy for pool workers that started on another one; kept as bytes so workers
+    that already hold the version skip unpickling it"""
+    return pickle.dumps(taxonomy, protocol=pickle.HIGHEST_PROTOCOL)
+
+@lru_cache(maxsize=None)
+def _signature_hasher():
+    """Index used by pool workers only to compute MinHash signatures for the parent's NearDuplicateIndex"""
+    return NearDuplicateIndex()
+
+def _process_resume_task(data, filename, industry, job_description, options, taxonomy_version, payload):
+    """Extract and score one upload in a pool worker; returns (record, dedup entry or None)"""
+    # Score against exactly the parent's taxonomy: the parent decodes the skill bitsets with its own profile.
+    # Workers never read skills.json themselves, as the file may have moved on from the parent's copy.
+    taxonomy = _worker_taxonomies.get(taxonomy_version)
+    if taxonomy is None:
+        taxonomy = pickle.loads(payload)
+        _worker_taxonomies[taxonomy_version] = taxonomy
+        if len(_worker_taxonomies) > 3:
+            # Keep the pool's own taxonomy, which tasks stop shipping, and the newest
+            del _worker_taxonomies[list(_worker_taxonomies)[1]]
+    _worker_analyzer.taxonomy = taxonomy
+    
+    extraction_mode = options.get('extractionMode', 'accurate')
+    resume_data, status, error = extract_resume(_worker_analyzer, data, filename, extraction_mode)
+    if resume_data is None:
+        return failed_file(_worker_analyzer, filename, status, error, extraction_mode), None
+    # Only the signature and contact keys travel back; the parent decides which copy is the representative
+    dedup_entry = None
+    if options.get('deduplicate'):
+        dedup_entry = (filename, resume_data['extractionMode'], _signature_hasher().signature(resume_data['content']),
+                       duplicate_keys(resume_data))
+    # The JD profile is built once per worker and taxonomy and then served from its LRU
+    return score_resume(_worker_analyzer, resume_data, industry, job_description, options), dedup_entry
+
+def get_process_pool():
+    """Lazily start the shared worker pool used by the 'process' execution mode.
+
+    Returns the pool and the version of the taxonomy its workers start on.
+    """
+    global _process_pool, _process_pool_taxonomy_version
+    with _process_pool_lock:
+        if _process_pool is None:
+            taxonomy = analyzer.taxonomy
+            _process_pool = ProcessPoolExecutor(
+                max_workers=app.config['ANALYZE_WORKERS'],
+                initializer=_init_worker,
+                initargs=(analyzer.skills_file, taxonomy, app.config['TEXT_CACHE_PATH'],
+                          app.config['TEXT_CACHE_MAX_BYTES'], analyzer.relevance_mode,
+                          analyzer.fast_pdf_max_pages, analyzer.fast_pdf_max_chars)
+            )
+            _process_pool_taxonomy_version = taxonomy.version
+        return _process_pool, _process_pool_taxonomy_version
+
+def discard_process_pool(pool):
+    """Shut down a pool whose worker died, so the next get_process_pool() starts a fresh one"""
+    global _process_pool
+    with _process_pool_lock:
+        # Another batch may already have replaced it
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def submit_bounded(submit, uploads, window, ordered=True, on_broken=None):
+    """Yield the results of submit(source, filename) futures, keeping at most ``window`` of them in flight.
+
+    ``uploads`` may be a lazy iterator (e.g. members still being read from
+    an archive); it is only advanced as results are taken, so scoring starts
+    straight away and memory stays flat however many files it holds.
+    With ``on_broken``, a file whose executor broke down before it was
+    done yields on_broken(filename, error) instead of raising.
+    """
+    def submit_file(source, filename):
+        try:
+            future = submit(source, filename)
+        except BrokenExecutor as e:
+            if on_broken is None:
+                raise
+            future = Future()
+            future.set_exception(e)
+        return filename, future
+    
+    def result(filename, future):
+        try:
+            return future.result()
+        except BrokenExecutor as e:
+            if on_broken is None:
+                raise
+            return on_broken(filename, e)
+    
+    if ordered:
+        pending = deque()
+        for source, filename in uploads:
+            pending.append(submit_file(source, filename))
+            if len(pending) >= window:
+                yield result(*pending.popleft())
+        while pending:
+            yield result(*pending.popleft())
+        return
+    
+    pending = {}
+    for source, filename in uploads:
+        filename, future = submit_file(source, filename)
+        pending[future] = filename
+        done = {future for future in pending if future.done()}
+        if len(pending) >= window and not done:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield result(pending.pop(future), future)
+    for future in as_completed(pending):
+        yield result(pending[future], future)
+
+def map_uploads(func, uploads, ordered=True):
+    """Yield func(source, filename) for each upload in the request thread.
+
+    With the extraction sandbox several uploads are handled at once on
+    threads (waiting on a sandbox child releases the GIL), so a file that
+    runs into the extraction timeout does not hold up the ones after it.
+    """
+    if analyzer.extraction_sandbox is None:
+        for source, filename in uploads:
+            yield func(source, filename)
+        return
+    
+    workers = analyzer.extraction_sandbox.workers
+    # Stages timed on the helper threads belong to the request's trace; they overlap, so a stage may add up
+    # to more than the request took
+    func = metrics.bind_trace(func)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from submit_bounded(partial(executor.submit, func), uploads, workers * 4, ordered)
+
+def iter_analyze_uploads(uploads, industry, job_description, options, profile, ordered=True):
+    """Yield a record for each (source, filename) pair using the configured execution mode.
+
+    Records are ResumeResults, failed_file records for uploads that could
+    not be scored, or 'duplicate' records when options['deduplicate'] is
+    set; ``record['status']`` tells the last two apart. With ``ordered``
+    records follow upload order; otherwise each one is yielded as soon as
+    its worker finishes. ``uploads`` may be a lazy iterator. In the
+    'process' mode a worker that dies fails the files the pool held at the
+    time, and the pool is replaced before the next file is submitted.
+    """
+    if app.config['ANALYZE_EXECUTION'] == 'process':
+        taxonomy = profile.taxonomy
+        
+        def submit_to(pool, pool_taxonomy_version, data, filename):
+            # Workers start on the pool's taxonomy; a reloaded one travels with each task
+            payload = None if taxonomy.version == pool_taxonomy_version else taxonomy_payload(taxonomy)
+            return pool.submit(_process_resume_task, data, filename, industry, job_description, options,
+                               taxonomy.version, payload)
+        
+        def submit(source, filename):
+            # Streams cannot cross the process boundary, so workers get the raw bytes
+            data = _read_source_bytes(source)
+            pool, pool_taxonomy_version = get_process_pool()
+            try:
+                return submit_to(pool, pool_taxonomy_version, data, filename)
+            except BrokenProcessPool:
+                # A worker died since the pool was last used; this file has not run, so it goes to a fresh pool
+                discard_process_pool(pool)
+                return submit_to(*get_process_pool(), data, filename)
+        
+        def on_broken(filename, error):
+            logger.error(f"Worker process died while {filename} was queued or being scored")
+            return failed_file(analyzer, filename, STATUS_ERROR, 'Worker process terminated abruptly',
+                               options.get('extractionMode', 'accurate')), None
+        
+        duplicates = NearDuplicateIndex(app.config['DEDUP_THRESHOLD']) if options.get('deduplicate') else None
+        names = []
+        window = app.config['ANALYZE_WORKERS'] * 4
+        for record, dedup_entry in submit_bounded(submit, uploads, window, ordered, on_broken):
+            if dedup_entry is not None:
+                filename, extraction_mode, signature, exact_keys = dedup_entry
+                with metrics.stage('dedup'):
+                    match = duplicates.add_signature(signature, exact_keys)
+                names.append(filename)
+                if match is not None:
+                    yield duplicate_record(filename, names, match, extraction_mode)
+                    continue
+            if isinstance(record, ResumeResult):
+                # Workers scored against this profile's taxonomy, so its skill bits decode the result
+                record.profile = profile
+            yield record
+    else:
+        for resume_data, record in iter_extracted_uploads(uploads, options, ordered):
+            if resume_data is None:
+                yield record
+            else:
+                yield score_resume(analyzer, resume_data, industry, job_description, options, profile)
+
+def duplicate_keys(resume_data):
+    """Contact details that identify a candidate exactly, as (kind, value) pairs"""
+    keys = []
+    if resume_data['email'] != 'Not found':
+        keys.append(('email', resume_data['email'].lower()))
+    # Shorter digit runs are more likely a stray number than a phone
+    if len(resume_data['phone']) >= 7:
+        keys.append(('phone', resume_data['phone']))
+    return keys
+
+def duplicate_record(filename, names, match, extraction_mode):
+    """Record reported in place of a result for a resume whose candidate was seen earlier in the batch.
+
+    ``names`` are the filenames added to the NearDuplicateIndex so far and
+    ``match`` is what its ``add`` returned.
+    """
+    representative, matched_on, similarity = match
+    return {
+        'name': filename,
+        'status': STATUS_DUPLICATE,
+        'duplicateOf': names[representative],
+        'matchedOn': matched_on,
+        'similarity': similarity,
+        'extractionMode': extraction_mode
+    }
+
+def iter_extracted_uploads(uploads, options, ordered=True):
+    """Extract and parse uploads, yielding (resume_data, None) per resume to score and (None, record) for the rest.
+
+    The records are failed_file records, and with ``options['deduplicate']``
+    'duplicate' records for resumes of a candidate seen earlier in the
+    batch, which are not scored again and point to the earlier resume.
+    """
+    extraction_mode = options.get('extractionMode', 'accurate')
+    duplicates = NearDuplicateIndex(app.config['DEDUP_THRESHOLD']) if options.get('deduplicate') else None
+    names = []
+    
+    extracted = map_uploads(
+        lambda source, filename: (filename, *extract_resume(analyzer, source, filename, extraction_mode)),
+        uploads, ordered)
+    for filename, resume_data, status, error in extracted:
+        if resume_data is None:
+            yield None, failed_file(analyzer, filename, status, error, extraction_mode)
+            continue
+        
+        if duplicates is not None:
+            with metrics.stage('dedup'):
+                match = duplicates.add(resume_data['content'], duplicate_keys(resume_data))
+            names.append(filename)
+            if match is not None:
+                yield None, duplicate_record(filename, names, match, resume_data['extractionMode'])
+                continue
+        
+        yield resume_data, None
+
+def analyze_uploads(uploads, industry, job_description, options, profile):
+    """Score (source, filename) uploads, archives included.
+
+    Returns the ResumeResults in upload order, the stats block, the failed files
+    and the duplicate records.
+    """
+    results = []
+    failures = []
+    duplicates = []
+    uploads = expand_archives(uploads, failures.append)
+    
+    stats = BatchStats()
+    for record in iter_analyze_uploads(uploads, industry, job_description, options, profile):
+        if isinstance(record, ResumeResult):
+            results.append(record)
+            stats.add(record)
+        elif record['status'] == STATUS_DUPLICATE:
+            duplicates.append(record)
+        else:
+            failures.append(record)
+    return results, stats.to_dict(), failures, duplicates
+
+def expand_archives(uploads, on_failure):
+    """Yield (source, filename) pairs with each archive replaced by its resumes, named by their archive path.
+
+    Members are read from the archive only as the caller advances, so the
+    first ones can be scored while the rest are still compressed. An
+    archive that is corrupt or over the limits stops being read and is
+    reported through on_failure(record); the other uploads carry on.
+    """
+    for source, filename in uploads:
+        if not is_archive(filename):
+            yield source, filename
+            continue
+        try:
+            yield from archive_reader.iter_members(source, filename)
+        except ArchiveError as e:
+            logger.warning(f"Rejected archive {filename}: {e}")
+            on_failure(failed_file(analyzer, filename, STATUS_ARCHIVE_ERROR, str(e)))
+
+def count_files(uploads):
+    """Number of resumes in the uploads, or None when an archive hides how many there are"""
+    if any(is_archive(filename) for _, filename in uploads):
+        return None
+    return len(uploads)
+
+def spool_upload(file):
+    """Seekable binary stream over an upload, without going through the upload folder.
+
+    Werkzeug already hands most uploads over as in-memory or spooled
+    streams; anything else is copied into a SpooledTemporaryFile that
+    only touches disk once it grows past UPLOAD_SPOOL_MAX_MEMORY.
+    """
+    stream = file.stream
+    if getattr(stream, 'seekable', lambda: False)():
+        stream.seek(0)
+        return stream
+    
+    spooled = tempfile.SpooledTemporaryFile(max_size=app.config['UPLOAD_SPOOL_MAX_MEMORY'])
+    shutil.copyfileobj(stream, spooled)
+    spooled.seek(0)
+    return spooled
+
+def read_uploaded_files(uploaded_files):
+    """Return (stream, filename) pairs for the non-empty uploads"""
+    uploads = [
+        (spool_upload(file), secure_filename(file.filename))
+        for file in uploaded_files
+        if file and file.filename != ''
+    ]
+    if metrics.enabled:
+        for stream, _ in uploads:
+            stream.seek(0, os.SEEK_END)
+            metrics.inc('bytes_read', stream.tell())
+            stream.seek(0)
+    return uploads
+
+class BatchStats:
+    """Running totals for the ``stats`` block, updated one result at a time"""
+
+    def __init__(self):
+        self.total = 0
+        self.score_sum = 0
+        self.relevance_sum = 0
+        self.with_technical = 0
+        self.with_soft = 0
+        self.with_certifications = 0
+        self.high_relevance = 0
+
+    def add(self, result):
+        """Count a ResumeResult; the skill checks are bitwise tests on its skill bitset"""
+        self._add(result.score, result.relevance_score, result.has_skills('technical'), result.has_skills('soft'),
+                  result.has_skills('certifications'))
+    
+    def add_record(self, record):
+        """Count a result already serialized by ResumeResult.to_dict, such as a scan output record"""
+        found_skills = record['foundSkills']
+        self._add(record['score'], record['relevanceScore'], bool(found_skills['technical']),
+                  bool(found_skills['soft']), bool(found_skills['certifications']))
+    
+    def _add(self, score, relevance_score, has_technical, has_soft, has_certifications):
+        self.total += 1
+        self.score_sum += score
+        self.relevance_sum += relevance_score
+        self.with_technical += 1 if has_technical else 0
+        self.with_soft += 1 if has_soft else 0
+        self.with_certifications += 1 if has_certifications else 0
+        self.high_relevance += 1 if relevance_score >= 70 else 0
+
+    def to_dict(self):
+        total = self.total
+        return {
+            'total': total,
+            'avgScore': round(self.score_sum / total if total > 0 else 0, 2),
+            'avgRelevance': round(self.relevance_sum / total if total > 0 else 0, 2),
+            'withTechnicalSkills': self.with_technical,
+            'withSoftSkills': self.with_soft,
+            'withCertifications': self.with_certifications,
+            'highRelevance': self.high_relevance
+        }
+
+def deduplicate_requested():
+    """The form's deduplicate flag ('on'/'off'), defaulting to the DEDUPLICATE setting"""
+    return request.form.get('deduplicate', 'on' if app.config['DEDUPLICATE'] else 'off') == 'on'
+
+def parse_analyze_request():
+    """Read the /analyze form; returns (job_description, industry, options, files) or an error response"""
+    job_description = request.form.get('jobDescription', '').strip()
+    industry = request.form.get('industry', '').strip()
+    
+    options = {
+        'deepAnalysis': request.form.get('deepAnalysis') == 'on',
+        'skillGaps': request.form.get('skillGaps') == 'on',
+        'salaryInsights': request.form.get('salaryInsights') == 'on',
+        'cultureFit': request.form.get('cultureFit') == 'on',
+        'extractionMode': request.form.get('extractionMode', '').strip() or app.config['PDF_EXTRACTION_MODE'],
+        'deduplicate': deduplicate_requested()
+    }
+    
+    if options['extractionMode'] not in EXTRACTION_MODES:
+        return None, (jsonify({'error': f"extractionMode must be one of: {', '.join(EXTRACTION_MODES)}"}), 400)
+    
+    if not job_description or len(job_description) < 10:
+        return None, (jsonify({'error': 'Job description is required and must be at least 10 characters long'}), 400)
+    
+    if not industry:
+        industry = analyzer.detect_industry(job_description)
+    
+    uploaded_files = request.files.getlist('resumes')
+    if not uploaded_files or all(file.filename == '' for file in uploaded_files):
+        return None, (jsonify({'error': 'No files uploaded'}), 400)
+    
+    return (job_description, industry, options, uploaded_files), None
+
+@app.before_request
+def start_request_timing():
+    g.request_started = time.perf_counter()
+    if app.config['SERVER_TIMING'] or request.args.get('timing') == '1':
+        metrics.start_trace()
+
+@app.after_request
+def finish_request_timing(response):
+    trace = metrics.end_trace()
+    started = g.pop('request_started', None)
+    # Streamed bodies are produced after this hook, so their timings would be meaningless
+    if started is None or response.is_streamed:
+        return response
+    
+    elapsed = time.perf_counter() - started
+    metrics.observe_request(request.endpoint or 'unknown', elapsed)
+    if trace is not None:
+        response.headers['Server-Timing'] = server_timing_header(trace, elapsed)
+    return response
+
+@app.route('/metrics')
+def get_metrics():
+    """Stage histograms and file counters of this worker in the Prometheus text format"""
+    if not metrics.enabled:
+        return jsonify({'error': 'Metrics are disabled'}), 404
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return render_template('index.html', pdf_extraction_mode=app.config['PDF_EXTRACTION_MODE'],
+                           deduplicate=app.config['DEDUPLICATE'])
 
 @app.route('/api/industry-skills/<industry>')
 def get_industry_skills(industry):
@@ -482,91 +1843,366 @@ def get_industry_skills(industry):
     skills = analyzer.industry_skills.get(industry, {})
     return jsonify(skills)
 
+@app.route('/api/detect-industry', methods=['POST'])
+def detect_job_industry():
+    """Ranked industry candidates for a job description"""
+    payload = request.get_json(silent=True) or request.form
+    job_description = (payload.get('jobDescription') or '').strip()
+    if not job_description:
+        return jsonify({'error': 'Job description is required'}), 400
+    
+    taxonomy = analyzer.taxonomy
+    ranked = taxonomy.industry_detector.rank(job_description)
+    return jsonify({
+        'industry': ranked[0][0] if ranked else 'technology',
+        'candidates': [{'industry': industry, 'score': score} for industry, score in ranked],
+        'taxonomyVersion': taxonomy.version
+    })
+
+@app.route('/api/job-profile-cache')
+def get_job_profile_cache_stats():
+    """Hit/miss counters of the per-JD analysis cache"""
+    return jsonify(analyzer.profile_cache.stats())
+
+@app.route('/api/text-cache')
+def get_text_cache_stats():
+    """Size and hit/miss counters of the extracted-text cache in this worker"""
+    if analyzer.text_cache is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **analyzer.text_cache.stats()})
+
 @app.route('/analyze', methods=['POST'])
 def analyze_resumes():
     """Analyze uploaded resumes with enhanced JD dependency"""
     try:
-        job_description = request.form.get('jobDescription', '').strip()
-        industry = request.form.get('industry', '').strip()
+        parsed, error_response = parse_analyze_request()
+        if error_response:
+            return error_response
+        job_description, industry, options, uploaded_files = parsed
         
-        options = {
-            'deepAnalysis': request.form.get('deepAnalysis') == 'on',
-            'skillGaps': request.form.get('skillGaps') == 'on',
-            'salaryInsights': request.form.get('salaryInsights') == 'on',
-            'cultureFit': request.form.get('cultureFit') == 'on'
-        }
+        profile = analyzer.get_job_profile(job_description, industry)
         
-        if not job_description or len(job_description) < 10:
-            return jsonify({'error': 'Job description is required and must be at least 10 characters long'}), 400
+        uploads = read_uploaded_files(uploaded_files)
+        results, stats, failures, duplicates = analyze_uploads(uploads, industry, job_description, options, profile)
         
-        if not industry:
-            industry = analyzer.detect_industry(job_description)
+        if not results:
+            return jsonify({'error': 'No valid resumes could be processed', 'failedFiles': failures}), 400
+        
+        response_data = {
+            'results': [result.to_dict() for result in
+                        sorted(results, key=lambda x: (x.relevance_score, x.score), reverse=True)],
+            'stats': stats,
+            'failedFiles': failures,
+            'duplicates': duplicates,
+            'industry': industry,
+            'jobDescription': job_description,
+            'taxonomyVersion': profile.taxonomy_version
+        }
+        with metrics.stage('serialize'):
+            return jsonify(response_data)
+    
+    except Exception as e:
+        logger.error(f"Error in analyze_resumes: {e}")
+        return jsonify({'error': 'An error occurred while processing resumes'}), 500
+
+@app.route('/analyze/stream', methods=['POST'])
+def analyze_resumes_stream():
+    """Stream each resume result as soon as it is scored, then a final stats message.
+
+    Emits newline-delimited JSON by default, or Server-Sent Events when
+    ``format=sse`` is given or the client accepts ``text/event-stream``.
+    """
+    parsed, error_response = parse_analyze_request()
+    if error_response:
+        return error_response
+    job_description, industry, options, uploaded_files = parsed
+    
+    use_sse = (request.args.get('format') == 'sse' or
+               request.accept_mimetypes.best == 'text/event-stream')
+    
+    def encode(message):
+        payload = json.dumps(message)
+        if use_sse:
+            return f"event: {message['type']}\ndata: {payload}\n\n"
+        return payload + "\n"
+    
+    def generate():
+        profile = analyzer.get_job_profile(job_description, industry)
+        stats = BatchStats()
+        try:
+            uploads = read_uploaded_files(uploaded_files)
+            # 'files' is null when archives are uploaded, as their members are only counted while scoring
+            yield encode({'type': 'start', 'files': count_files(uploads), 'industry': industry,
+                          'taxonomyVersion': profile.taxonomy_version})
+            
+            rejected = []
+            for record in iter_analyze_uploads(expand_archives(uploads, rejected.append), industry,
+                                               job_description, options, profile, ordered=False):
+                if isinstance(record, ResumeResult):
+                    stats.add(record)
+                    yield encode({'type': 'result', 'result': record.to_dict()})
+                elif record['status'] == STATUS_DUPLICATE:
+                    yield encode({'type': 'duplicate', 'duplicate': record})
+                else:
+                    yield encode({'type': 'failure', 'failure': record})
+                while rejected:
+                    yield encode({'type': 'failure', 'failure': rejected.pop(0)})
+            for record in rejected:
+                yield encode({'type': 'failure', 'failure': record})
+            
+            if stats.total:
+                yield encode({
+                    'type': 'stats',
+                    'stats': stats.to_dict(),
+                    'industry': industry,
+                    'jobDescription': job_description
+                })
+            else:
+                yield encode({'type': 'error', 'error': 'No valid resumes could be processed'})
+        except Exception as e:
+            logger.error(f"Error in analyze_resumes_stream: {e}")
+            yield encode({'type': 'error', 'error': 'An error occurred while processing resumes'})
+    
+    mimetype = 'text/event-stream' if use_sse else 'application/x-ndjson'
+    return Response(stream_with_context(generate()), mimetype=mimetype,
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/analyze/matrix', methods=['POST'])
+def analyze_matrix():
+    """Score every uploaded resume against several job descriptions, extracting each file once.
+
+    Takes the /analyze upload form with ``jobDescriptions`` repeated once
+    per role and, optionally, ``industries`` in the same order. Returns
+    N x M ``scores`` and ``relevanceScores`` matrices, rows following
+    ``candidates`` and columns following ``jobs``, and the best-fitting
+    role of each candidate, picked the way /analyze ranks results.
+    """
+    try:
+        job_descriptions = [jd.strip() for jd in request.form.getlist('jobDescriptions')]
+        industries = [industry.strip() for industry in request.form.getlist('industries')]
+        extraction_mode = request.form.get('extractionMode', '').strip() or app.config['PDF_EXTRACTION_MODE']
+        
+        if extraction_mode not in EXTRACTION_MODES:
+            return jsonify({'error': f"extractionMode must be one of: {', '.join(EXTRACTION_MODES)}"}), 400
+        if not job_descriptions or any(len(jd) < 10 for jd in job_descriptions):
+            return jsonify({'error': 'Every job description is required and must be at least 10 characters long'}), 400
+        if len(job_descriptions) > app.config['MATRIX_MAX_JOBS']:
+            return jsonify({'error': f"At most {app.config['MATRIX_MAX_JOBS']} job descriptions can be compared"}), 400
+        if industries and len(industries) != len(job_descriptions):
+            return jsonify({'error': 'industries must have one entry per job description'}), 400
         
         uploaded_files = request.files.getlist('resumes')
         if not uploaded_files or all(file.filename == '' for file in uploaded_files):
             return jsonify({'error': 'No files uploaded'}), 400
         
-        results = []
-        processed_files = []
+        # One taxonomy snapshot for every column, even if skills.json is reloaded meanwhile
+        taxonomy = analyzer.taxonomy
+        industries = [industry or analyzer.detect_industry(jd)
+                      for jd, industry in zip(job_descriptions, industries or [''] * len(job_descriptions))]
+        profiles = [analyzer.get_job_profile(jd, industry, taxonomy) for jd, industry in zip(job_descriptions, industries)]
+        scorer = MatrixScorer(analyzer, profiles)
+        
+        candidates = []
+        scores = []
+        relevance_scores = []
+        failures = []
+        duplicates = []
+        options = {
+            'extractionMode': extraction_mode,
+            'deduplicate': deduplicate_requested()
+        }
+        extracted = iter_extracted_uploads(
+            expand_archives(read_uploaded_files(uploaded_files), failures.append), options)
+        for resume_data, record in extracted:
+            if resume_data is None:
+                (duplicates if record['status'] == STATUS_DUPLICATE else failures).append(record)
+                continue
+            
+            with metrics.stage('matrix_score'):
+                row_scores, row_relevance = scorer.score(resume_data)
+            best = max(range(len(profiles)), key=lambda column: (row_relevance[column], row_scores[column]))
+            candidates.append({
+                'name': resume_data['name'],
+                'email': resume_data['email'],
+                'phone': resume_data['phone'],
+                'extractionMode': resume_data['extractionMode'],
+                'bestJob': best,
+                'bestScore': row_scores[best],
+                'bestRelevanceScore': row_relevance[best]
+            })
+            scores.append(row_scores)
+            relevance_scores.append(row_relevance)
+        
+        if not candidates:
+            return jsonify({'error': 'No valid resumes could be processed', 'failedFiles': failures}), 400
+        
+        return jsonify({
+            'jobs': [{'index': column, 'industry': profile.industry, 'experienceLevel': profile.experience_level}
+                     for column, profile in enumerate(profiles)],
+            'candidates': candidates,
+            'scores': scores,
+            'relevanceScores': relevance_scores,
+            'failedFiles': failures,
+            'duplicates': duplicates,
+            'taxonomyVersion': taxonomy.version
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in analyze_matrix: {e}")
+        return jsonify({'error': 'An error occurred while processing resumes'}), 500
+
+def run_analysis_job(job, uploads, industry, job_description, options):
+    """Job body for POST /jobs: the /analyze pipeline, recording progress as files finish"""
+    profile = analyzer.get_job_profile(job_description, industry)
+    job.metadata['taxonomyVersion'] = profile.taxonomy_version
+    stats = BatchStats()
+    for record in iter_analyze_uploads(expand_archives(uploads, job.record_failure), industry, job_description,
+                                       options, profile, ordered=False):
+        if isinstance(record, ResumeResult):
+            stats.add(record)
+            job.record(record, stats.to_dict())
+        elif record['status'] == STATUS_DUPLICATE:
+            job.record_duplicate(record)
+        else:
+            job.record_failure(record)
+    if job.total is None:
+        job.total = job.processed
+
+@app.route('/jobs', methods=['POST'])
+def create_analysis_job():
+    """Queue an /analyze batch in the background and return its job id"""
+    try:
+        parsed, error_response = parse_analyze_request()
+        if error_response:
+            return error_response
+        job_description, industry, options, uploaded_files = parsed
+        
+        # The request streams are gone once this returns, so keep the bytes for the job
+        uploads = [(_read_source_bytes(source), filename) for source, filename in read_uploaded_files(uploaded_files)]
+        
+        job = job_manager.submit(
+            lambda job: run_analysis_job(job, uploads, industry, job_description, options),
+            total=count_files(uploads),
+            metadata={'industry': industry}
+        )
+        return jsonify({'jobId': job.id, 'status': job.status, 'total': job.total,
+                        'statusUrl': f"/jobs/{job.id}"}), 202
+    
+    except Exception as e:
+        logger.error(f"Error in create_analysis_job: {e}")
+        return jsonify({'error': 'An error occurred while queueing resumes'}), 500
+
+@app.route('/jobs/<job_id>')
+def get_analysis_job(job_id):
+    """Progress and results so far of a queued batch"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found or expired'}), 404
+    
+    job_data = job.to_dict()
+    job_data['results'].sort(key=lambda x: (x['relevanceScore'], x['score']), reverse=True)
+    return jsonify(job_data)
+
+@app.route('/candidates', methods=['POST'])
+def ingest_candidates():
+    """Extract, parse and add uploaded resumes to the persistent candidate index"""
+    try:
+        uploaded_files = request.files.getlist('resumes')
+        if not uploaded_files or all(file.filename == '' for file in uploaded_files):
+            return jsonify({'error': 'No files uploaded'}), 400
         
-        for file in uploaded_files:
-            if file and file.filename != '':
-                filename = secure_filename(file.filename)
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(file_path)
-                processed_files.append(file_path)
-                
-                try:
-                    content = analyzer.extract_text_from_file(file_path, filename)
-                    
-                    if content.strip():
-                        resume_data = analyzer.parse_resume_content(content, filename)
-                        
-                        result = analyzer.analyze_resume(resume_data, industry, job_description, options)
-                        results.append(result)
-                    else:
-                        logger.warning(f"No text extracted from {filename}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing {filename}: {e}")
-                    continue
+        candidate_index = get_candidate_index()
+        taxonomy = analyzer.taxonomy
+        indexed = []
+        duplicates = []
+        failed = []
         
-        for file_path in processed_files:
+        for source, filename in expand_archives(read_uploaded_files(uploaded_files), failed.append):
             try:
-                os.remove(file_path)
+                resume_data, status, error = extract_resume(analyzer, source, filename,
+                                                            app.config['PDF_EXTRACTION_MODE'])
+                if resume_data is None:
+                    failed.append({'name': filename, 'status': status, 'error': error})
+                    continue
+                
+                matched = taxonomy.skill_matcher.match(resume_data['content'].lower())
+                phrases = analyzer.build_phrase_index(resume_data['content'])
+                candidate_id, created = candidate_index.add(resume_data, matched, phrases, taxonomy.version)
+                (indexed if created else duplicates).append({'name': filename, 'candidateId': candidate_id})
+            
             except Exception as e:
-                logger.error(f"Error removing file {file_path}: {e}")
+                logger.error(f"Error indexing {filename}: {e}")
+                failed.append({'name': filename, 'status': STATUS_ERROR, 'error': str(e) or type(e).__name__})
+        
+        return jsonify({
+            'indexed': indexed,
+            'duplicates': duplicates,
+            'failed': failed,
+            'poolSize': candidate_index.count()
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in ingest_candidates: {e}")
+        return jsonify({'error': 'An error occurred while indexing resumes'}), 500
+
+@app.route('/candidates/search', methods=['POST'])
+def search_candidates():
+    """Rank every indexed candidate against a job description and return the top K"""
+    try:
+        payload = request.get_json(silent=True) or request.form
+        job_description = (payload.get('jobDescription') or '').strip()
+        industry = (payload.get('industry') or '').strip()
         
-        if not results:
-            return jsonify({'error': 'No valid resumes could be processed'}), 400
+        if not job_description or len(job_description) < 10:
+            return jsonify({'error': 'Job description is required and must be at least 10 characters long'}), 400
         
-        total = len(results)
-        avg_score = sum(r['score'] for r in results) / total if total > 0 else 0
-        avg_relevance = sum(r['relevanceScore'] for r in results) / total if total > 0 else 0
-        with_technical = sum(1 for r in results if len(r['foundSkills']['technical']) > 0)
-        with_soft = sum(1 for r in results if len(r['foundSkills']['soft']) > 0)
-        with_certifications = sum(1 for r in results if len(r['foundSkills']['certifications']) > 0)
-        high_relevance = sum(1 for r in results if r['relevanceScore'] >= 70)
+        try:
+            top_k = min(max(int(payload.get('topK', 20)), 1), 1000)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'topK must be an integer'}), 400
         
-        response_data = {
-            'results': sorted(results, key=lambda x: (x['relevanceScore'], x['score']), reverse=True),
-            'stats': {
-                'total': total,
-                'avgScore': round(avg_score, 2),
-                'avgRelevance': round(avg_relevance, 2),
-                'withTechnicalSkills': with_technical,
-                'withSoftSkills': with_soft,
-                'withCertifications': with_certifications,
-                'highRelevance': high_relevance
-            },
+        if not industry:
+            industry = analyzer.detect_industry(job_description)
+        
+        started = time.perf_counter()
+        taxonomy = analyzer.taxonomy
+        candidate_index = get_candidate_index()
+        # Candidates matched under an older skills.json are re-matched before ranking
+        stale_candidates = candidate_index.refresh_skills(taxonomy)
+        profile = analyzer.get_job_profile(job_description, industry, taxonomy)
+        results, pool_size = candidate_index.search(analyzer, profile, top_k)
+        
+        return jsonify({
+            'results': results,
+            'poolSize': pool_size,
+            'staleCandidates': stale_candidates,
             'industry': industry,
-            'jobDescription': job_description
-        }
-        return jsonify(response_data)
+            'taxonomyVersion': profile.taxonomy_version,
+            'elapsedMs': round((time.perf_counter() - started) * 1000, 2)
+        })
     
     except Exception as e:
-        logger.error(f"Error in analyze_resumes: {e}")
-        return jsonify({'error': 'An error occurred while processing resumes'}), 500
+        logger.error(f"Error in search_candidates: {e}")
+        return jsonify({'error': 'An error occurred while searching candidates'}), 500
+
+def admin_authorized():
+    token = app.config['ADMIN_TOKEN']
+    return bool(token) and hmac.compare_digest(request.headers.get('X-Admin-Token', ''), token)
+
+@app.route('/admin/reload-skills', methods=['POST'])
+def reload_skills():
+    """Re-read skills.json and swap in the new taxonomy; running requests finish on the old one"""
+    if not admin_authorized():
+        return jsonify({'error': 'Forbidden'}), 403
+    
+    previous = analyzer.taxonomy_version
+    try:
+        reloaded = analyzer.reload_industry_data(force=request.args.get('force') == '1')
+    except Exception as e:
+        logger.error(f"Error reloading {analyzer.skills_file}: {e}")
+        return jsonify({'error': 'Could not reload skills file', 'taxonomyVersion': previous}), 400
+    
+    return jsonify({'reloaded': reloaded, 'previousVersion': previous, 'taxonomyVersion': analyzer.taxonomy_version})
 
 @app.route('/delete-resume', methods=['POST'])
 def delete_resume():
@@ -595,4 +2231,4 @@ def internal_error(e):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='127.0.0.1', port=5000)
\ No newline at end of file
+    create_app().run(debug=True, host='127.0.0.1', port=5000)
\ No newline at end of file
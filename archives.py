@@ -0,0 +1,126 @@
+import io
+import posixpath
+import tarfile
+import zipfile
+import zlib
+
+from werkzeug.utils import secure_filename
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz')
+
+
+class ArchiveError(ValueError):
+    """Raised for an archive that cannot be read or is over the reader's limits"""
+
+
+def is_archive(filename):
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _member_path(name):
+    """Archive path of a wanted member, each component sanitized like a top-level upload's filename"""
+    # Tar members are often stored as ./dir/file; components that sanitize to nothing, like '..', are dropped
+    *dirs, leaf = posixpath.normpath(name).split('/')
+    stem, ext = posixpath.splitext(leaf)
+    # The extension already passed wants(); keep it even when a non-ASCII stem sanitizes to nothing
+    parts = [secure_filename(part) for part in dirs] + [(secure_filename(stem) or 'resume') + ext]
+    return '/'.join(part for part in parts if part)
+
+
+class ArchiveReader:
+    """Yields the resume files of an uploaded ZIP or TAR archive one member at a time.
+
+    Members are decompressed into memory only when the caller asks for the
+    next one, so scoring can start while the rest of the archive is still
+    unread and nothing is written to disk. An archive with more than
+    ``max_members`` entries, any member above ``max_member_bytes`` or more
+    than ``max_total_bytes`` of content in total raises ArchiveError;
+    declared sizes are checked before anything is decompressed and ZIP
+    members are re-checked while they are read, since their headers may lie.
+    """
+
+    def __init__(self, member_types, max_members=1000, max_total_bytes=256 * 1024 * 1024,
+                 max_member_bytes=16 * 1024 * 1024):
+        self.member_types = tuple(member_types)
+        self.max_members = max_members
+        self.max_total_bytes = max_total_bytes
+        self.max_member_bytes = max_member_bytes
+
+    def wants(self, path):
+        """Whether a member is a resume; directories, dotfiles and macOS metadata are skipped"""
+        parts = path.split('/')
+        if '__MACOSX' in parts or parts[-1].startswith('.') or '.' not in parts[-1]:
+            return False
+        return parts[-1].lower().rsplit('.', 1)[-1] in self.member_types
+
+    def iter_members(self, source, archive_name):
+        """Yield (bytes, member path) for each resume in the archive; source is bytes or a binary stream"""
+        stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray, memoryview)) else source
+        if archive_name.lower().endswith('.zip'):
+            return self._iter_zip(stream, archive_name)
+        return self._iter_tar(stream, archive_name)
+
+    def _check_member_size(self, size, path, remaining, archive_name):
+        if size > self.max_member_bytes:
+            raise ArchiveError(f"{path} in {archive_name} is larger than {self.max_member_bytes} bytes")
+        if size > remaining:
+            raise ArchiveError(f"{archive_name} holds more than {self.max_total_bytes} bytes")
+
+    def _iter_zip(self, stream, archive_name):
+        try:
+            archive = zipfile.ZipFile(stream)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise ArchiveError(f"{archive_name} is not a readable ZIP archive") from e
+
+        with archive:
+            infos = archive.infolist()
+            if len(infos) > self.max_members:
+                raise ArchiveError(f"{archive_name} has more than {self.max_members} entries")
+            if sum(info.file_size for info in infos) > self.max_total_bytes:
+                raise ArchiveError(f"{archive_name} holds more than {self.max_total_bytes} bytes")
+
+            remaining = self.max_total_bytes
+            for info in infos:
+                if info.is_dir() or not self.wants(info.filename):
+                    continue
+                path = _member_path(info.filename)
+                self._check_member_size(info.file_size, path, remaining, archive_name)
+                try:
+                    with archive.open(info) as member:
+                        # One byte past the limit shows whether the header understated the size
+                        data = member.read(min(self.max_member_bytes, remaining) + 1)
+                except (zipfile.BadZipFile, RuntimeError, NotImplementedError, zlib.error, OSError) as e:
+                    # RuntimeError covers encrypted members, NotImplementedError unknown compression
+                    raise ArchiveError(f"Could not read {path} from {archive_name}: {e}") from e
+                self._check_member_size(len(data), path, remaining, archive_name)
+                remaining -= len(data)
+                yield data, path
+
+    def _iter_tar(self, stream, archive_name):
+        try:
+            # Stream mode reads the archive front to back without seeking; compression is auto-detected
+            archive = tarfile.open(fileobj=stream, mode='r|*')
+        except (tarfile.TarError, EOFError, zlib.error, OSError) as e:
+            raise ArchiveError(f"{archive_name} is not a readable TAR archive") from e
+
+        with archive:
+            entries = 0
+            remaining = self.max_total_bytes
+            try:
+                for member in archive:
+                    entries += 1
+                    if entries > self.max_members:
+                        raise ArchiveError(f"{archive_name} has more than {self.max_members} entries")
+                    if not member.isfile():
+                        continue
+                    # Skipped members are decompressed too when the stream moves past them
+                    if member.size > remaining:
+                        raise ArchiveError(f"{archive_name} holds more than {self.max_total_bytes} bytes")
+                    remaining -= member.size
+                    if not self.wants(member.name):
+                        continue
+                    path = _member_path(member.name)
+                    self._check_member_size(member.size, path, remaining + member.size, archive_name)
+                    yield archive.extractfile(member).read(), path
+            except (tarfile.TarError, EOFError, zlib.error, OSError) as e:
+                raise ArchiveError(f"Could not read {archive_name}: {e}") from e
@@ -0,0 +1,8 @@
+"""Performance benchmarks for the resume scanner.
+
+``corpus`` builds deterministic synthetic resumes and job descriptions from
+skills.json; ``run`` times each analysis stage on them. Run from the
+repository root::
+
+    python -m benchmarks.run --resumes 200 --output benchmarks/results/latest.json
+"""
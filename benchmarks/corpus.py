@@ -0,0 +1,170 @@
+import io
+import json
+import random
+
+from docx import Document
+
+FILE_TYPES = ('pdf', 'docx', 'txt')
+
+FIRST_NAMES = ['Maria', 'James', 'Aiko', 'Carlos', 'Priya', 'Liam', 'Fatima', 'Noah', 'Elena', 'Kwame']
+LAST_NAMES = ['Santos', 'Smith', 'Tanaka', 'Garcia', 'Patel', 'Murphy', 'Haddad', 'Johnson', 'Rossi', 'Mensah']
+
+FILLER_WORDS = (
+    "worked with team members to deliver projects on time and improve quality across the organization "
+    "responsible for planning reporting stakeholders customers growth learning ownership results years "
+    "experience senior junior lead managed built designed delivered maintained supported collaboration"
+).split()
+
+JD_OPENERS = [
+    "We are looking for a {level} professional to join our {industry} team.",
+    "Our growing {industry} company is hiring a {level} specialist.",
+    "Join a {industry} organization that values innovation, growth and learning."
+]
+
+LEVELS = ['junior', 'mid-level', 'senior', 'lead']
+
+# Lines per PDF page and characters per line for the generated documents
+PDF_LINES_PER_PAGE = 60
+PDF_LINE_WIDTH = 90
+
+
+class CorpusGenerator:
+    """Deterministic synthetic resumes and job descriptions built from skills.json.
+
+    The same seed always yields the same texts and file bytes, so benchmark
+    runs on different commits measure the same inputs. Resumes mix an
+    industry's skills and keywords with filler prose at a configurable word
+    count and are rendered as PDF, DOCX or plain text.
+    """
+
+    def __init__(self, skills_file='skills.json', seed=42):
+        with open(skills_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.industry_skills = data.get('industrySkills', {})
+        self.industry_keywords = data.get('industryKeywords', {})
+        self.industries = sorted(self.industry_skills)
+        self.seed = seed
+
+    def _vocabulary(self, industry):
+        skills = [skill for category in self.industry_skills.get(industry, {}).values() for skill in category]
+        return skills, self.industry_keywords.get(industry, [])
+
+    def _sentences(self, rng, industry, words):
+        """Filler prose of roughly ``words`` words, one third skills and keywords"""
+        skills, keywords = self._vocabulary(industry)
+        vocabulary = skills + keywords
+        sentences = []
+        count = 0
+        while count < words:
+            length = rng.randint(8, 18)
+            sentence = [rng.choice(vocabulary) if rng.random() < 0.33 else rng.choice(FILLER_WORDS)
+                        for _ in range(length)]
+            sentences.append(' '.join(sentence).capitalize() + '.')
+            count += length
+        return sentences
+
+    def resume_text(self, index, industry=None, words=400):
+        """Plain-text resume with contact details, a skills section and experience prose"""
+        rng = random.Random(f"{self.seed}:resume:{index}")
+        industry = industry or self.industries[index % len(self.industries)]
+        skills, _ = self._vocabulary(industry)
+
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        lines = [
+            name,
+            f"{name.lower().replace(' ', '.')}{index}@example.com",
+            f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+            "",
+            "Skills",
+            ', '.join(rng.sample(skills, min(len(skills), rng.randint(5, 15)))),
+            "",
+            "Experience"
+        ]
+        lines.extend(self._sentences(rng, industry, words))
+        return '\n'.join(lines)
+
+    def job_description(self, industry, words=150, index=0):
+        """Job description for an industry mentioning its keywords and a sample of its skills"""
+        rng = random.Random(f"{self.seed}:jd:{industry}:{index}")
+        skills, keywords = self._vocabulary(industry)
+        lines = [rng.choice(JD_OPENERS).format(level=rng.choice(LEVELS), industry=industry)]
+        lines.append(f"Requirements: {rng.randint(1, 10)}+ years of experience with "
+                     + ', '.join(rng.sample(skills, min(len(skills), 8))) + '.')
+        lines.append("Keywords: " + ', '.join(keywords) + '.')
+        lines.extend(self._sentences(rng, industry, words))
+        return '\n'.join(lines)
+
+    def render(self, text, file_type):
+        """File bytes of a text in one of FILE_TYPES"""
+        if file_type == 'pdf':
+            return render_pdf(text)
+        if file_type == 'docx':
+            return render_docx(text)
+        if file_type == 'txt':
+            return text.encode('utf-8')
+        raise ValueError(f"Unsupported file type: {file_type}")
+
+    def resumes(self, count, words=400, file_types=FILE_TYPES):
+        """(bytes, filename) pairs for ``count`` resumes, cycling through the file types"""
+        files = []
+        for index in range(count):
+            file_type = file_types[index % len(file_types)]
+            files.append((self.render(self.resume_text(index, words=words), file_type),
+                          f"resume_{index:05d}.{file_type}"))
+        return files
+
+
+def render_docx(text):
+    """DOCX bytes with one paragraph per line"""
+    doc = Document()
+    for line in text.split('\n'):
+        doc.add_paragraph(line)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(text):
+    """Minimal uncompressed PDF with Helvetica text, wrapped and paginated.
+
+    Written by hand so the benchmarks need no PDF authoring library; the
+    output is plain enough for pdfplumber to extract the text back.
+    """
+    lines = []
+    for line in text.encode('latin-1', 'replace').decode('latin-1').split('\n'):
+        while len(line) > PDF_LINE_WIDTH:
+            cut = line.rfind(' ', 0, PDF_LINE_WIDTH)
+            cut = cut if cut > 0 else PDF_LINE_WIDTH
+            lines.append(line[:cut])
+            line = line[cut:].lstrip()
+        lines.append(line)
+    pages = [lines[i:i + PDF_LINES_PER_PAGE] for i in range(0, len(lines), PDF_LINES_PER_PAGE)] or [[]]
+
+    # 1: catalog, 2: page tree, 3: font, then a page object and a content stream per page
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(pages)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+    ]
+    for page_id, page_lines in zip(page_ids, pages):
+        stream = "BT /F1 10 Tf 40 800 Td 12 TL\n" + "\n".join(
+            f"({_pdf_escape(line)}) '" for line in page_lines) + "\nET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents {page_id + 1} 0 R"
+                       " /Resources << /Font << /F1 3 0 R >> >> >>")
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+
+    output = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output.encode('latin-1')))
+        output += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(output.encode('latin-1'))
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    output += ''.join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return output.encode('latin-1')
@@ -0,0 +1,259 @@
+"""Time each analysis stage on a synthetic corpus and write the results as JSON.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run --resumes 300 --words 600 --output benchmarks/results/latest.json
+    python -m benchmarks.run --output new.json --baseline benchmarks/results/latest.json
+
+Every stage reports throughput and p50/p95/p99 latency per sample; with
+``--baseline`` the p50 of each stage is compared to an earlier run. The
+``startup.*`` stages time ``import app``, ``create_app()`` and the first
+/analyze request in fresh interpreters, as a new web or pool worker pays them.
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.corpus import FILE_TYPES, CorpusGenerator
+
+ALL_OPTIONS = {'deepAnalysis': True, 'skillGaps': True, 'salaryInsights': True, 'cultureFit': True}
+
+# Run with ``python -c`` in a fresh interpreter; prints the three start-up durations as JSON
+STARTUP_SCRIPT = """
+import io, json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.create_app()
+created = time.perf_counter()
+response = app.app.test_client().post('/analyze', data={
+    'jobDescription': sys.argv[1],
+    'resumes': [(io.BytesIO(sys.argv[2].encode('utf-8')), 'resume.txt')]
+}, content_type='multipart/form-data')
+finished = time.perf_counter()
+if response.status_code != 200:
+    sys.exit(f"/analyze returned {response.status_code}")
+print(json.dumps({'import': imported - started, 'create_app': created - imported, 'first_request': finished - created}))
+"""
+
+
+def percentile(sorted_values, fraction):
+    """Linearly interpolated percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class StageTimer:
+    """Collects durations per named stage; a sample may cover several items (e.g. a batch request)"""
+
+    def __init__(self):
+        self.samples = {}
+        self.items = {}
+
+    def record(self, stage, seconds, items=1):
+        self.samples.setdefault(stage, []).append(seconds)
+        self.items[stage] = self.items.get(stage, 0) + items
+
+    def measure(self, stage, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        self.record(stage, time.perf_counter() - started)
+        return result
+
+    def summary(self):
+        report = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            total = sum(ordered)
+            report[stage] = {
+                'samples': len(ordered),
+                'items': self.items[stage],
+                'totalSeconds': round(total, 6),
+                'itemsPerSecond': round(self.items[stage] / total, 2) if total > 0 else None,
+                'meanMs': round(total / len(ordered) * 1000, 4),
+                'p50Ms': round(percentile(ordered, 0.50) * 1000, 4),
+                'p95Ms': round(percentile(ordered, 0.95) * 1000, 4),
+                'p99Ms': round(percentile(ordered, 0.99) * 1000, 4)
+            }
+        return report
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_stages(app_module, files, job_description, industry, repeat, timer):
+    """Time extraction, parsing, matching, relevance and the optional analyses one resume at a time"""
+    analyzer = app_module.analyzer
+
+    profile = timer.measure('job_profile', app_module.JobProfile, analyzer, job_description, industry)
+
+    for _ in range(repeat):
+        for data, filename in files:
+            file_ext = filename.rsplit('.', 1)[-1]
+            # extract_text_by_type bypasses the text cache, so every pass really parses the file
+            content = timer.measure(f'extraction.{file_ext}', analyzer.extract_text_by_type, data, file_ext)
+            resume_data = timer.measure('parse_resume_content', analyzer.parse_resume_content, content, filename)
+
+            content_lower = resume_data['content'].lower()
+            skills = timer.measure('skill_matching', analyzer.match_skills, content_lower, profile)
+            skill_counts = {category: profile.count_skills(skills, category) for category in app_module.SKILL_CATEGORIES}
+
+            timer.measure('relevance', analyzer.calculate_jd_relevance_score, resume_data['content'], profile)
+
+            timer.measure('skill_gaps', analyzer.identify_skill_gaps, skills, profile)
+            timer.measure('salary_estimate', analyzer.estimate_salary_based_on_jd,
+                          skill_counts, job_description, profile.experience_level, profile.salary_keyword_bonus)
+            timer.measure('culture_fit', analyzer.estimate_culture_fit,
+                          resume_data['content'], job_description, profile.culture_keywords)
+            timer.measure('analyze_resume', analyzer.analyze_resume,
+                          resume_data, industry, job_description, ALL_OPTIONS, profile)
+
+
+def run_startup(job_description, resume_text, runs, timer):
+    """Time a cold start in ``runs`` fresh interpreters, each ending with one TXT /analyze request"""
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT, job_description, resume_text],
+                                   capture_output=True, text=True, env=os.environ.copy())
+        if completed.returncode != 0:
+            raise RuntimeError(f"Start-up run failed: {completed.stderr.strip()[-200:]}")
+        for stage, seconds in json.loads(completed.stdout.strip().splitlines()[-1]).items():
+            timer.record(f'startup.{stage}', seconds)
+
+
+def run_end_to_end(app_module, files, job_description, industry, requests, batch_size, timer):
+    """Time POST /analyze through the Flask test client, one batch of files per request"""
+    client = app_module.app.test_client()
+    batch_size = min(batch_size, len(files))
+
+    for request_number in range(requests):
+        start = request_number * batch_size
+        batch = [files[(start + offset) % len(files)] for offset in range(batch_size)]
+        data = {
+            'jobDescription': job_description,
+            'industry': industry,
+            **{key: 'on' for key in ALL_OPTIONS},
+            'resumes': [(io.BytesIO(content), filename) for content, filename in batch]
+        }
+
+        started = time.perf_counter()
+        response = client.post('/analyze', data=data, content_type='multipart/form-data')
+        elapsed = time.perf_counter() - started
+        if response.status_code != 200:
+            raise RuntimeError(f"/analyze returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+        timer.record('end_to_end_analyze', elapsed, items=batch_size)
+
+
+def compare(report, baseline):
+    """p50 of each stage relative to a baseline report; negative change means faster"""
+    comparison = {}
+    for stage, current in report['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous or not previous.get('p50Ms'):
+            continue
+        comparison[stage] = {
+            'baselineP50Ms': previous['p50Ms'],
+            'p50Ms': current['p50Ms'],
+            'changePercent': round((current['p50Ms'] - previous['p50Ms']) / previous['p50Ms'] * 100, 2)
+        }
+    return comparison
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--resumes', type=int, default=120, help='synthetic resumes in the corpus')
+    parser.add_argument('--words', type=int, default=400, help='approximate words per resume')
+    parser.add_argument('--jd-words', type=int, default=150, help='approximate words per job description')
+    parser.add_argument('--industry', default='technology', help='industry of the job description')
+    parser.add_argument('--formats', default=','.join(FILE_TYPES), help='comma-separated file types to generate')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='passes over the corpus for the stage timings')
+    parser.add_argument('--requests', type=int, default=10, help='/analyze requests for the end-to-end timing')
+    parser.add_argument('--batch-size', type=int, default=20, help='resumes per /analyze request')
+    parser.add_argument('--skip-end-to-end', action='store_true')
+    parser.add_argument('--startup-runs', type=int, default=3, help='fresh interpreters for the start-up timing')
+    parser.add_argument('--text-cache', action='store_true',
+                        help='keep the extracted-text cache enabled for /analyze (disabled by default)')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--baseline', help='earlier JSON report to compare p50 latencies against')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    file_types = tuple(file_type.strip() for file_type in args.formats.split(',') if file_type.strip())
+    unknown = set(file_types) - set(FILE_TYPES)
+    if unknown or not file_types:
+        sys.exit(f"Unsupported formats: {', '.join(sorted(unknown)) or '(none)'}")
+
+    # app reads its configuration at import time
+    if not args.text_cache:
+        os.environ['RESUME_SCANNER_TEXT_CACHE'] = ''
+    import app as app_module
+    app_module.create_app()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    corpus = CorpusGenerator(app_module.analyzer.skills_file, seed=args.seed)
+    started = time.perf_counter()
+    files = corpus.resumes(args.resumes, words=args.words, file_types=file_types)
+    job_description = corpus.job_description(args.industry, words=args.jd_words)
+    generation_seconds = time.perf_counter() - started
+
+    timer = StageTimer()
+    if args.startup_runs > 0:
+        run_startup(job_description, corpus.resume_text(0, words=args.words), args.startup_runs, timer)
+    run_stages(app_module, files, job_description, args.industry, args.repeat, timer)
+    if not args.skip_end_to_end:
+        run_end_to_end(app_module, files, job_description, args.industry, args.requests, args.batch_size, timer)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpusSeconds': round(generation_seconds, 3),
+            'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+            'relevanceMode': app_module.analyzer.relevance_mode,
+            'execution': app_module.app.config['ANALYZE_EXECUTION']
+        },
+        'stages': timer.summary()
+    }
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report['comparison'] = compare(report, json.load(f))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        for stage, summary in report['stages'].items():
+            change = report.get('comparison', {}).get(stage)
+            suffix = f"  ({change['changePercent']:+.1f}% p50)" if change else ''
+            print(f"{stage:24} {summary['itemsPerSecond'] or 0:>12.1f}/s  p50 {summary['p50Ms']:.3f}ms"
+                  f"  p95 {summary['p95Ms']:.3f}ms  p99 {summary['p99Ms']:.3f}ms{suffix}")
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
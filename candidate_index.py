@@ -0,0 +1,292 @@
+import hashlib
+import heapq
+import logging
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+
+from sqlite_connections import ThreadLocalConnections
+
+logger = logging.getLogger(__name__)
+
+WORD_REGEX = re.compile(r'\b\w+\b')
+
+# Candidates indexed under any taxonomy other than the bound one; a range
+# form of "IS NOT ?" so SQLite can use idx_candidates_taxonomy
+STALE_CANDIDATES = "(taxonomy_version IS NULL OR taxonomy_version < ? OR taxonomy_version > ?)"
+
+
+def phrase_hash(phrase):
+    """Stable 56-bit hash of a phrase; fits SQLite's signed INTEGER on every platform"""
+    return int.from_bytes(hashlib.blake2b(phrase.encode('utf-8'), digest_size=7).digest(), 'big')
+
+
+class CandidateIndex:
+    """On-disk inverted index of parsed resumes for ranking a JD against the whole pool.
+
+    Each resume is ingested once into skill postings (vocabulary skills the
+    analyzer's matcher found), term postings with term frequencies, and
+    hashed postings of the analyzer's phrase index. ``search`` then scores a
+    JobProfile with the same signals as ``analyze_resume`` (found skills, JD
+    skill matches, phrase relevance) using aggregate queries instead of
+    re-reading files. JD skills outside the vocabulary are looked up by
+    their words, and relevance always uses the phrase index, so results can
+    differ slightly from the legacy 'substring' relevance mode.
+
+    Skill postings depend on the taxonomy, so every candidate records the
+    taxonomy version it was matched with and keeps its compressed text;
+    ``refresh_skills`` re-matches candidates after skills.json changes, and
+    ``search`` leaves out any it could not.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connections = ThreadLocalConnections(path)
+        self._refresh_lock = threading.Lock()
+
+        conn = self._connections.get()
+        conn.executescript(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            " id INTEGER PRIMARY KEY,"
+            " content_hash TEXT NOT NULL UNIQUE,"
+            " name TEXT NOT NULL,"
+            " email TEXT,"
+            " phone TEXT,"
+            " token_count INTEGER NOT NULL,"
+            " indexed_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS skill_postings ("
+            " skill TEXT NOT NULL,"
+            " candidate_id INTEGER NOT NULL,"
+            " PRIMARY KEY (skill, candidate_id)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS term_postings ("
+            " term TEXT NOT NULL,"
+            " candidate_id INTEGER NOT NULL,"
+            " tf INTEGER NOT NULL,"
+            " PRIMARY KEY (term, candidate_id)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS ngram_postings ("
+            " ngram_hash INTEGER NOT NULL,"
+            " candidate_id INTEGER NOT NULL,"
+            " PRIMARY KEY (ngram_hash, candidate_id)) WITHOUT ROWID;"
+        )
+        # Indexes created before candidates kept their text lack the taxonomy columns;
+        # their rows stay stale until the resume is ingested again
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(candidates)")}
+        if 'taxonomy_version' not in columns:
+            conn.execute("ALTER TABLE candidates ADD COLUMN taxonomy_version TEXT")
+        if 'content' not in columns:
+            conn.execute("ALTER TABLE candidates ADD COLUMN content BLOB")
+        conn.executescript(
+            "CREATE INDEX IF NOT EXISTS idx_candidates_taxonomy ON candidates (taxonomy_version);"
+            "CREATE INDEX IF NOT EXISTS idx_skill_postings_candidate ON skill_postings (candidate_id);"
+        )
+        conn.commit()
+
+    def count(self):
+        return self._connections.get().execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def add(self, resume_data, matched_skills, phrases, taxonomy_version):
+        """Index a parse_resume_content result; returns (candidate_id, created).
+
+        ``matched_skills`` are the lowercased vocabulary skills found in the
+        resume by the taxonomy ``taxonomy_version``, and ``phrases`` its
+        phrase index. A resume whose cleaned text is already indexed is not
+        added twice.
+        """
+        content_lower = resume_data['content'].lower()
+        content_hash = hashlib.sha256(content_lower.encode('utf-8')).hexdigest()
+        tokens = WORD_REGEX.findall(content_lower)
+
+        conn = self._connections.get()
+        row = conn.execute("SELECT id FROM candidates WHERE content_hash = ?", (content_hash,)).fetchone()
+        if row is not None:
+            return row[0], False
+
+        with conn:
+            candidate_id = conn.execute(
+                "INSERT INTO candidates (content_hash, name, email, phone, token_count, indexed_at,"
+                " taxonomy_version, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (content_hash, resume_data['name'], resume_data['email'], resume_data['phone'],
+                 len(tokens), time.time(), taxonomy_version,
+                 zlib.compress(resume_data['content'].encode('utf-8')))
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO skill_postings (skill, candidate_id) VALUES (?, ?)",
+                ((skill, candidate_id) for skill in matched_skills)
+            )
+            conn.executemany(
+                "INSERT INTO term_postings (term, candidate_id, tf) VALUES (?, ?, ?)",
+                ((term, candidate_id, tf) for term, tf in Counter(tokens).items())
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO ngram_postings (ngram_hash, candidate_id) VALUES (?, ?)",
+                ((phrase_hash(phrase), candidate_id) for phrase in phrases)
+            )
+        return candidate_id, True
+
+    def refresh_skills(self, taxonomy, batch_size=500):
+        """Re-match the skills of candidates indexed under another taxonomy.
+
+        Runs one short write transaction per batch so ingestion in other
+        workers is never blocked for long. Returns how many candidates are
+        still stale: those indexed before their text was stored.
+        """
+        version = taxonomy.version
+        conn = self._connections.get()
+        with self._refresh_lock:
+            while conn.execute(f"SELECT 1 FROM candidates WHERE {STALE_CANDIDATES} AND content IS NOT NULL LIMIT 1",
+                               (version, version)).fetchone():
+                # IMMEDIATE takes the write lock before reading, so two workers never re-match one batch twice
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    rows = conn.execute(
+                        f"SELECT id, content FROM candidates WHERE {STALE_CANDIDATES} AND content IS NOT NULL LIMIT ?",
+                        (version, version, batch_size)
+                    ).fetchall()
+                    for candidate_id, content in rows:
+                        matched = taxonomy.skill_matcher.match(zlib.decompress(content).decode('utf-8').lower())
+                        conn.execute("DELETE FROM skill_postings WHERE candidate_id = ?", (candidate_id,))
+                        conn.executemany(
+                            "INSERT INTO skill_postings (skill, candidate_id) VALUES (?, ?)",
+                            ((skill, candidate_id) for skill in matched)
+                        )
+                        conn.execute("UPDATE candidates SET taxonomy_version = ? WHERE id = ?", (version, candidate_id))
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+                logger.info(f"Re-matched skills of {len(rows)} indexed candidates for taxonomy {version}")
+            return conn.execute(f"SELECT COUNT(*) FROM candidates WHERE {STALE_CANDIDATES}",
+                                (version, version)).fetchone()[0]
+
+    def _candidates_with_phrase(self, conn, analyzer, text, contenders_only):
+        """Candidates whose words contain a skill that is not in the indexed vocabulary"""
+        tokens = WORD_REGEX.findall(text.lower())
+        if not tokens:
+            return set()
+
+        contenders = " AND candidate_id IN (SELECT id FROM query_candidates)" if contenders_only else ""
+        phrase = ' '.join(tokens)
+        if phrase in analyzer.build_phrase_index(phrase):
+            rows = conn.execute("SELECT candidate_id FROM ngram_postings WHERE ngram_hash = ?" + contenders,
+                                (phrase_hash(phrase),))
+            return {candidate_id for candidate_id, in rows}
+
+        # Single words, very short phrases and long ones fall back to requiring every term
+        candidates = None
+        for term in set(tokens):
+            rows = conn.execute("SELECT candidate_id FROM term_postings WHERE term = ?" + contenders, (term,))
+            term_candidates = {candidate_id for candidate_id, in rows}
+            candidates = term_candidates if candidates is None else candidates & term_candidates
+            if not candidates:
+                break
+        return candidates or set()
+
+    def search(self, analyzer, profile, top_k=20):
+        """Rank the candidates indexed under the profile's taxonomy against it; returns (results, pool_size).
+
+        Relevance orders the results first, so the phrase postings of the JD
+        are aggregated once and only candidates whose rounded relevance
+        reaches the K-th best are scored on skills. Skill-only candidates
+        are ranked as well when fewer than K candidates share a JD phrase.
+        """
+        conn = self._connections.get()
+        # Filling the query tables opens a transaction; closing it releases this thread's read snapshot,
+        # so the next search sees candidates other workers ingested meanwhile
+        with conn:
+            results = self._rank(conn, analyzer, profile, top_k)
+        return results, self.count()
+
+    def _rank(self, conn, analyzer, profile, top_k):
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS query_skills (skill TEXT PRIMARY KEY, weight REAL NOT NULL)")
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS query_phrases (ngram_hash INTEGER PRIMARY KEY, weight INTEGER NOT NULL)")
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS query_candidates (id INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM query_skills")
+        conn.execute("DELETE FROM query_phrases")
+        conn.execute("DELETE FROM query_candidates")
+
+        jd_only_skills = profile.jd_only_skills
+        conn.executemany(
+            "INSERT INTO query_skills (skill, weight) VALUES (?, ?)",
+            ((skill, weight) for skill, weight in profile.skill_weights.items() if skill not in jd_only_skills)
+        )
+        phrase_weights = Counter()
+        for phrase, weight in profile.relevance_phrase_weights.items():
+            phrase_weights[phrase_hash(phrase)] += weight
+        conn.executemany("INSERT INTO query_phrases (ngram_hash, weight) VALUES (?, ?)", phrase_weights.items())
+
+        version = profile.taxonomy_version
+        stale = {candidate_id for candidate_id, in conn.execute(
+            f"SELECT id FROM candidates WHERE {STALE_CANDIDATES}", (version, version)
+        )}
+
+        # CROSS JOIN keeps the small query table as the outer loop, so only the JD's posting lists are read
+        phrase_matches = dict(conn.execute(
+            "SELECT p.candidate_id, SUM(q.weight) FROM query_phrases q"
+            " CROSS JOIN ngram_postings p ON p.ngram_hash = q.ngram_hash GROUP BY p.candidate_id"
+        ))
+        for candidate_id in stale:
+            phrase_matches.pop(candidate_id, None)
+
+        # Rounded relevance only depends on the match count, of which there are few distinct values
+        rounded_relevance = {matches: round(profile.relevance_score(matches), 1) for matches in set(phrase_matches.values())}
+        kth_matches = heapq.nlargest(top_k, phrase_matches.values())
+        contenders_only = len(kth_matches) == top_k and rounded_relevance[kth_matches[-1]] > 0
+        if contenders_only:
+            # Candidates below the K-th rounded relevance cannot reach the top K, whatever their skills
+            threshold = rounded_relevance[kth_matches[-1]]
+            contenders = {candidate_id for candidate_id, matches in phrase_matches.items()
+                          if rounded_relevance[matches] >= threshold}
+            conn.executemany("INSERT INTO query_candidates (id) VALUES (?)", ((candidate_id,) for candidate_id in contenders))
+            skill_rows = conn.execute(
+                "SELECT p.candidate_id, p.skill FROM query_candidates c"
+                " CROSS JOIN skill_postings p ON p.candidate_id = c.id"
+                " JOIN query_skills q ON q.skill = p.skill"
+            )
+        else:
+            contenders = set(phrase_matches)
+            skill_rows = conn.execute(
+                "SELECT p.candidate_id, p.skill FROM query_skills q"
+                " CROSS JOIN skill_postings p ON p.skill = q.skill"
+            )
+
+        matched_skills = {}
+        for candidate_id, skill in skill_rows:
+            if candidate_id not in stale:
+                matched_skills.setdefault(candidate_id, set()).add(skill)
+        for skill in jd_only_skills:
+            for candidate_id in self._candidates_with_phrase(conn, analyzer, skill, contenders_only):
+                if candidate_id not in stale:
+                    matched_skills.setdefault(candidate_id, set()).add(skill)
+        contenders.update(matched_skills)
+
+        def rank(candidate_id):
+            relevance_score = profile.relevance_score(phrase_matches.get(candidate_id, 0))
+            score = sum(profile.skill_weights.get(skill, 0) for skill in matched_skills.get(candidate_id, ()))
+            score += relevance_score / 10
+            return round(relevance_score, 1), round(score, 1)
+
+        ranked = heapq.nlargest(top_k, ((rank(candidate_id), candidate_id) for candidate_id in contenders))
+
+        results = []
+        for (relevance_score, score), candidate_id in ranked:
+            name, email, phone = conn.execute(
+                "SELECT name, email, phone FROM candidates WHERE id = ?", (candidate_id,)
+            ).fetchone()
+            skills = profile.skill_mask(matched_skills.get(candidate_id, ()))
+            jd_skill_matches, _ = analyzer.score_skill_matches(skills, profile)
+
+            results.append({
+                'candidateId': candidate_id,
+                'name': name,
+                'email': email,
+                'phone': phone,
+                'foundSkills': profile.found_skills(skills),
+                'score': score,
+                'relevanceScore': relevance_score,
+                'experienceLevel': profile.experience_level,
+                'jdSkillMatches': jd_skill_matches
+            })
+
+        return results
@@ -0,0 +1,157 @@
+import random
+import re
+import zlib
+from functools import lru_cache
+
+WORD_REGEX = re.compile(r'\w+')
+
+_MASK_64 = (1 << 64) - 1
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy, imported with the first index rather than with the module; None when it is not installed"""
+    try:
+        import numpy
+    except ImportError:  # Signatures are then computed one permutation at a time in pure Python
+        return None
+    return numpy
+
+
+class NearDuplicateIndex:
+    """Groups resumes of the same candidate as they arrive, in time linear in the batch size.
+
+    Each text is reduced to a MinHash signature over its word shingles,
+    and the signature is split into ``bands`` LSH buckets. A new resume is
+    only compared with earlier ones that share a bucket, and is a duplicate
+    when its estimated Jaccard similarity to one of them reaches
+    ``threshold``. The same email address or phone number is an exact
+    match on its own. Each resume in a cluster points to its first member,
+    the representative.
+
+    Permutations are multiply-shift hashes of CRC-32 shingle hashes, seeded,
+    so signatures are the same in every process. The first resume is only
+    hashed once a second one is added, so a single-file batch never
+    computes a signature or imports NumPy.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=16, shingle_size=3, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        # Odd multipliers keep each multiply-shift hash a permutation of the 64-bit space
+        self._multipliers = [rng.getrandbits(64) | 1 for _ in range(num_perm)]
+        self._increments = [rng.getrandbits(64) for _ in range(num_perm)]
+        self._np_permutations = None
+
+        self._buckets = {}
+        self._exact = {}
+        self._signatures = []
+        self._representatives = []
+        self._first_text = None
+
+    def shingles(self, text):
+        words = WORD_REGEX.findall(text.lower())
+        if len(words) < self.shingle_size:
+            return set(words)
+        return set(map(' '.join, zip(*(words[offset:] for offset in range(self.shingle_size)))))
+
+    def signature(self, text):
+        """MinHash signature of a text as a tuple of ints, or None if it has no words"""
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in self.shingles(text)]
+        if not hashes:
+            return None
+        np = _numpy()
+        if np is not None:
+            if self._np_permutations is None:
+                self._np_permutations = (np.array(self._multipliers, dtype=np.uint64),
+                                         np.array(self._increments, dtype=np.uint64))
+            multipliers, increments = self._np_permutations
+            values = np.array(hashes, dtype=np.uint64)
+            # uint64 arithmetic wraps, which is the mod 2**64 multiply-shift needs
+            permuted = (np.outer(values, multipliers) + increments) >> np.uint64(32)
+            return tuple(permuted.min(axis=0).tolist())
+        return tuple(
+            min(((multiplier * value + increment) & _MASK_64) >> 32 for value in hashes)
+            for multiplier, increment in zip(self._multipliers, self._increments)
+        )
+
+    def similarity(self, first, second):
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for a, b in zip(first, second) if a == b) / self.num_perm
+
+    def add(self, text, exact_keys=()):
+        """Index one resume and return (representative id, reason, similarity) if it duplicates an earlier one.
+
+        Ids count from 0 in the order resumes are added; ``reason`` is
+        'email', 'phone' or 'content'. ``exact_keys`` are (kind, value)
+        pairs such as ('email', 'jane@example.com').
+        """
+        doc_id = len(self._signatures)
+        if doc_id == 0:
+            self._first_text = text
+            signature = None
+        else:
+            self._hash_first_text()
+            signature = self.signature(text)
+        return self._add(doc_id, signature, exact_keys)
+
+    def add_signature(self, signature, exact_keys=()):
+        """Like ``add`` for a signature computed elsewhere, e.g. by the worker process that extracted the text.
+
+        The index that computed it must have the same ``num_perm``, ``bands``,
+        ``shingle_size`` and ``seed``; ``threshold`` may differ.
+        """
+        self._hash_first_text()
+        return self._add(len(self._signatures), signature, exact_keys)
+
+    def _hash_first_text(self):
+        if self._first_text is not None:
+            self._index_signature(0, self.signature(self._first_text))
+            self._first_text = None
+
+    def _add(self, doc_id, signature, exact_keys):
+        match = None
+
+        for kind, value in exact_keys:
+            other = self._exact.get((kind, value))
+            if other is not None:
+                match = (self._representatives[other], kind, 1.0)
+                break
+
+        if signature is not None and match is None:
+            best = None
+            seen = set()
+            for band_key in self._band_keys(signature):
+                for other in self._buckets.get(band_key, ()):
+                    if other in seen:
+                        continue
+                    seen.add(other)
+                    score = self.similarity(signature, self._signatures[other])
+                    if score >= self.threshold and (best is None or score > best[1]):
+                        best = (other, score)
+            if best is not None:
+                match = (self._representatives[best[0]], 'content', round(best[1], 3))
+
+        # Duplicates are indexed too, so a chain of small revisions still ends at one representative
+        self._signatures.append(None)
+        self._representatives.append(match[0] if match else doc_id)
+        self._index_signature(doc_id, signature)
+        for key in exact_keys:
+            self._exact.setdefault(key, doc_id)
+        return match
+
+    def _band_keys(self, signature):
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _index_signature(self, doc_id, signature):
+        self._signatures[doc_id] = signature
+        if signature is not None:
+            for band_key in self._band_keys(signature):
+                self._buckets.setdefault(band_key, []).append(doc_id)
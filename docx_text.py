@@ -0,0 +1,90 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_P = _W + 'p'
+_R = _W + 'r'
+_T = _W + 't'
+_TAB = _W + 'tab'
+_BREAKS = (_W + 'br', _W + 'cr')
+# Parts whose direct children are the paragraphs, tables and content controls of the document
+_BLOCK_CONTAINERS = (_W + 'body', _W + 'hdr', _W + 'ftr')
+# Text boxes are stored twice, as DrawingML and as a VML fallback for old readers; only the first is read
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+_MAIN_PART = 'word/document.xml'
+_HEADER_PART = re.compile(r'word/header\d*\.xml$')
+_FOOTER_PART = re.compile(r'word/footer\d*\.xml$')
+
+
+def iter_paragraphs(stream):
+    """Yield the text of every paragraph in a WordprocessingML part, in document order.
+
+    The part is parsed incrementally and each top-level block is dropped
+    once read, so memory does not grow with the document. Paragraphs in
+    tables, content controls and text boxes are included; a text box
+    paragraph comes before the paragraph that anchors it. Runs read like
+    python-docx's Run.text: tabs become '\\t' and line breaks '\\n'.
+    """
+    open_elements = []
+    paragraphs = []
+    fallback_depth = 0
+
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            open_elements.append(elem)
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1
+            elif tag == _P and not fallback_depth:
+                paragraphs.append([])
+            continue
+
+        open_elements.pop()
+        if tag == _MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth or not paragraphs:
+            pass
+        elif tag == _T:
+            if elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == _TAB:
+            # w:tab also defines tab stops in paragraph properties; only a run's w:tab is text
+            if open_elements[-1].tag == _R:
+                paragraphs[-1].append('\t')
+        elif tag in _BREAKS:
+            paragraphs[-1].append('\n')
+        elif tag == _P:
+            text = ''.join(paragraphs.pop())
+            # Paragraphs of a large table would otherwise stay in memory until the table ends
+            elem.clear()
+            yield text
+
+        if open_elements and open_elements[-1].tag in _BLOCK_CONTAINERS:
+            open_elements[-1].remove(elem)
+
+
+def read_docx_text(source):
+    """Text of a DOCX file, one line per paragraph; source is a path or a binary stream.
+
+    Header parts come first and footer parts last, around the body, keeping
+    only their non-blank paragraphs. Only the XML parts are decompressed,
+    never embedded images or fonts.
+    """
+    with zipfile.ZipFile(source) as archive:
+        names = archive.namelist()
+        if _MAIN_PART not in names:
+            raise ValueError(f"Not a DOCX file: {_MAIN_PART} is missing")
+
+        lines = []
+        for name in sorted(name for name in names if _HEADER_PART.match(name)):
+            with archive.open(name) as part:
+                lines.extend(text for text in iter_paragraphs(part) if text.strip())
+        with archive.open(_MAIN_PART) as part:
+            lines.extend(iter_paragraphs(part))
+        for name in sorted(name for name in names if _FOOTER_PART.match(name)):
+            with archive.open(name) as part:
+                lines.extend(text for text in iter_paragraphs(part) if text.strip())
+
+    return ''.join(f"{line}\n" for line in lines)
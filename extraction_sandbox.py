@@ -0,0 +1,167 @@
+import logging
+import multiprocessing
+import os
+import threading
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; workers then run without a memory cap
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Per-file outcomes reported by ExtractionSandbox.extract
+STATUS_OK = 'ok'
+STATUS_TIMEOUT = 'timeout'
+STATUS_OOM = 'oom'
+STATUS_PARSE_ERROR = 'parse_error'
+
+
+def _address_space_size():
+    """Current virtual memory size of this process in bytes, or 0 if unknown"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _reply(conn, message):
+    """Send a job's outcome to the parent; False once the parent has gone away"""
+    try:
+        conn.send(message)
+    except (BrokenPipeError, ConnectionResetError):
+        return False
+    return True
+
+
+def _sandbox_main(conn, parent_conn, extract, memory_limit):
+    """Worker loop: run extract(data, file_ext, mode) for each job sent over the pipe"""
+    # Forking copied the parent's end of the pipe; without closing it recv() never sees EOF, so a child
+    # would outlive a parent that was killed and keep the parent's own process sentinel open
+    parent_conn.close()
+    if memory_limit and resource is not None:
+        # The budget is on top of what the forked interpreter already maps
+        limit = _address_space_size() + memory_limit
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+
+        data, file_ext, mode = job
+        try:
+            sent = _reply(conn, (STATUS_OK, extract(data, file_ext, mode), None))
+        except MemoryError:
+            # The heap may be left fragmented, so start over in a fresh process
+            _reply(conn, (STATUS_OOM, '', 'Memory limit exceeded'))
+            return
+        except Exception as e:
+            sent = _reply(conn, (STATUS_PARSE_ERROR, '', str(e) or type(e).__name__))
+        if not sent:
+            return
+
+
+class _SandboxProcess:
+    def __init__(self, context, extract, memory_limit):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_sandbox_main, args=(child_conn, self.conn, extract, memory_limit),
+                                       name='extraction-sandbox', daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def alive(self):
+        return self.process.is_alive()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class ExtractionSandbox:
+    """Runs text extraction in supervised child processes with a timeout and memory cap.
+
+    Each child handles one file at a time under an RLIMIT_AS budget of
+    ``memory_limit`` bytes. The calling thread waits at most ``timeout``
+    seconds; a child that overruns is killed and replaced, and one that runs
+    out of memory or dies is replaced too, so a pathological file only ever
+    costs its own slot. ``extract`` must raise on unreadable input; it is
+    handed to the children by fork, so it need not be picklable.
+    """
+
+    def __init__(self, extract, workers=2, timeout=30, memory_limit=512 * 1024 * 1024):
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Extraction sandbox requires the 'fork' start method")
+        self.extract_func = extract
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._context = multiprocessing.get_context('fork')
+        self._slots = threading.BoundedSemaphore(workers)
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _checkout(self):
+        """Take an idle child, forking one when none is left; the caller holds a slot"""
+        with self._lock:
+            while self._idle:
+                child = self._idle.pop()
+                if child.alive():
+                    return child
+                child.conn.close()
+        return _SandboxProcess(self._context, self.extract_func, self.memory_limit)
+
+    def extract(self, data, file_ext, mode):
+        """Return (text, status, error) for one file's bytes"""
+        with self._slots:
+            child = self._checkout()
+            try:
+                child.conn.send((data, file_ext, mode))
+                if not child.conn.poll(self.timeout):
+                    logger.warning(f"Extraction of a {file_ext} file timed out after {self.timeout}s")
+                    child.kill()
+                    child = None
+                    return '', STATUS_TIMEOUT, f"Extraction timed out after {self.timeout}s"
+
+                status, text, error = child.conn.recv()
+                if status == STATUS_OOM:
+                    # The child exits after reporting, see _sandbox_main
+                    child.process.join()
+                    child.conn.close()
+                    child = None
+                return text, status, error
+            except (EOFError, OSError):
+                # The child died without answering; the kernel OOM killer sends SIGKILL
+                child.process.join(timeout=1)
+                exitcode = child.process.exitcode
+                child.conn.close()
+                child = None
+                if exitcode == -9:
+                    return '', STATUS_OOM, 'Extraction process was killed'
+                return '', STATUS_PARSE_ERROR, f"Extraction process exited with code {exitcode}"
+            finally:
+                if child is not None:
+                    with self._lock:
+                        self._idle.append(child)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for child in idle:
+            child.stop()
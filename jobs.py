@@ -0,0 +1,117 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    """Progress and partial results of one queued batch"""
+
+    def __init__(self, total, metadata=None):
+        self.id = uuid.uuid4().hex
+        self.status = 'queued'
+        self.total = total
+        self.processed = 0
+        self.results = []
+        self.failures = []
+        self.duplicates = []
+        self.stats = None
+        self.error = None
+        self.metadata = metadata or {}
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def record(self, result, stats=None):
+        """Count one processed file; result is None when the file produced nothing"""
+        with self._lock:
+            self.processed += 1
+            if result is not None:
+                self.results.append(result)
+            if stats is not None:
+                self.stats = stats
+
+    def record_failure(self, failure):
+        """Count one processed file that could not be scored, keeping the record of why"""
+        with self._lock:
+            self.processed += 1
+            self.failures.append(failure)
+
+    def record_duplicate(self, duplicate):
+        """Count one processed file that repeats a candidate already in the batch"""
+        with self._lock:
+            self.processed += 1
+            self.duplicates.append(duplicate)
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'jobId': self.id,
+                'status': self.status,
+                'total': self.total,
+                'processed': self.processed,
+                'results': [result.to_dict() for result in self.results],
+                'failedFiles': list(self.failures),
+                'duplicates': list(self.duplicates),
+                'stats': self.stats,
+                'error': self.error,
+                'createdAt': self.created_at,
+                'startedAt': self.started_at,
+                'finishedAt': self.finished_at,
+                **self.metadata
+            }
+
+
+class JobManager:
+    """In-process job queue drained by a local thread pool.
+
+    Finished jobs are kept for ``ttl`` seconds and then dropped. Jobs live
+    in the memory of the process that accepted them, so no outside service
+    is needed, but with several web workers status requests must reach the
+    same worker (e.g. a single gunicorn worker with threads).
+    """
+
+    def __init__(self, max_workers=2, ttl=3600):
+        self.ttl = ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='resume-job')
+
+    def submit(self, run, total, metadata=None):
+        """Queue ``run(job)`` and return the new Job straight away"""
+        self.purge_expired()
+        job = Job(total, metadata)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, run)
+        return job
+
+    def _run(self, job, run):
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            run(job)
+            job.status = 'completed'
+        except Exception as e:
+            logger.error(f"Error in job {job.id}: {e}")
+            job.error = 'An error occurred while processing resumes'
+            job.status = 'failed'
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id):
+        self.purge_expired()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def purge_expired(self):
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
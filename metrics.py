@@ -0,0 +1,205 @@
+import threading
+import time
+from bisect import bisect_left
+
+# Upper bounds in seconds; wide enough for a 0.1 ms regex and a multi-second PDF
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, optionally split by label values"""
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {} if self.labels else {(): 0}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, *label_values):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram of durations in seconds, optionally split by label values"""
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        # First bucket whose upper bound is >= value; the extra last slot is +Inf
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                # Per-bucket (not yet cumulative) counts, then sum and count
+                entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_values, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(self.labels, label_values, [('le', _format_value(float(bound)))])
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labels, label_values, [('le', '+Inf')])
+                lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _format_labels(self.labels, label_values)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class _NullTimer:
+    """Stand-in returned by Metrics.stage when nothing is being recorded"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    __slots__ = ('metrics', 'stage', 'trace', 'started')
+
+    def __init__(self, metrics, stage, trace):
+        self.metrics = metrics
+        self.stage = stage
+        self.trace = trace
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        elapsed = time.perf_counter() - self.started
+        if self.metrics.enabled:
+            self.metrics.stage_seconds.observe(elapsed, self.stage)
+        if self.trace is not None:
+            # A trace handed to helper threads with bind_trace() is updated from several threads at once
+            with self.metrics._trace_lock:
+                self.trace[self.stage] = self.trace.get(self.stage, 0.0) + elapsed
+        return False
+
+
+class _TraceState(threading.local):
+    # A class default keeps the lookup cheap on threads that never opened a trace
+    trace = None
+
+
+class Metrics:
+    """Stage timings and counters of one process, rendered in the Prometheus text format.
+
+    ``stage(name)`` times a block into a histogram and, while a request
+    trace is open on the current thread, adds it to that trace for the
+    Server-Timing header. With metrics disabled and no open trace it hands
+    back a shared no-op context manager, so instrumented code pays one
+    thread-local lookup per stage.
+    """
+
+    def __init__(self, enabled=True, namespace='resume_scanner'):
+        self.enabled = enabled
+        self._local = _TraceState()
+        self._trace_lock = threading.Lock()
+        self.stage_seconds = Histogram(f"{namespace}_stage_seconds", "Time spent in each analysis stage.", ('stage',))
+        self.request_seconds = Histogram(f"{namespace}_request_seconds", "Time to build each response.", ('endpoint',))
+        self.counters = {
+            'files_processed': Counter(f"{namespace}_files_processed_total", "Resume files extracted."),
+            'bytes_read': Counter(f"{namespace}_bytes_read_total", "Bytes of uploaded resume files read."),
+            'extraction_failures': Counter(f"{namespace}_extraction_failures_total",
+                                           "Files whose extraction failed, timed out or ran out of memory.",
+                                           ('file_type', 'status')),
+            'empty_text': Counter(f"{namespace}_empty_text_total", "Resumes that yielded no text.")
+        }
+
+    def stage(self, name):
+        trace = self._local.trace
+        if not self.enabled and trace is None:
+            return _NULL_TIMER
+        return _StageTimer(self, name, trace)
+
+    def inc(self, name, amount=1, *label_values):
+        if self.enabled:
+            self.counters[name].inc(amount, *label_values)
+
+    def observe_request(self, endpoint, seconds):
+        if self.enabled:
+            self.request_seconds.observe(seconds, endpoint)
+
+    def start_trace(self):
+        """Collect stage durations of the current thread until end_trace()"""
+        self._local.trace = {}
+
+    def bind_trace(self, func):
+        """func wrapped so that, called on another thread, its stages go to the current thread's trace"""
+        trace = self._local.trace
+        if trace is None:
+            return func
+
+        def traced(*args, **kwargs):
+            previous = self._local.trace
+            self._local.trace = trace
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.trace = previous
+        return traced
+
+    def end_trace(self):
+        """Stop collecting and return {stage: seconds} for the current thread, or None"""
+        trace = self._local.trace
+        self._local.trace = None
+        return trace
+
+    def render(self):
+        lines = []
+        for metric in (self.stage_seconds, self.request_seconds, *self.counters.values()):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+def server_timing_header(trace, total=None):
+    """Server-Timing header value for a {stage: seconds} trace"""
+    entries = [f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in trace.items()]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.2f}")
+    return ', '.join(entries)
@@ -0,0 +1,261 @@
+"""Rank a directory of resumes against a job description without going through /analyze.
+
+Usage::
+
+    python scan.py --jd job.txt resumes/ --output results.jsonl
+    python scan.py --jd job.txt "share/**/*.pdf" --output results.csv --workers 8 --top-k 50
+    python scan.py --jd job.txt resumes/ --output results.jsonl --resume
+
+Files are extracted and scored in worker processes and each result is
+appended to the output (JSONL or CSV, from the extension or ``--format``)
+as soon as it finishes. With ``--resume`` files whose path is already in
+the output are skipped, so an interrupted scan picks up where it stopped.
+"""
+import argparse
+import csv
+import glob
+import heapq
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from app import (BatchStats, EXTRACTION_MODES, RELEVANCE_MODES, ResumeAnalyzer, ResumeResult,
+                 create_extraction_sandbox, create_text_cache, process_resume_file)
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+CSV_FIELDS = [
+    'path', 'status', 'name', 'email', 'phone', 'score', 'relevanceScore', 'experienceLevel',
+    'jdSkillMatches', 'technicalSkills', 'softSkills', 'certifications', 'extractionMode', 'summary', 'error'
+]
+
+_scan_analyzer = None
+
+
+def _init_scan_worker(skills_file, text_cache_path, relevance_mode):
+    global _scan_analyzer
+    _scan_analyzer = ResumeAnalyzer(
+        skills_file,
+        text_cache=create_text_cache(text_cache_path, 256 * 1024 * 1024),
+        relevance_mode=relevance_mode
+    )
+    _scan_analyzer.extraction_sandbox = create_extraction_sandbox(_scan_analyzer, 1)
+
+
+def _scan_file(path, industry, job_description, options):
+    """Score one file in a worker; returns an output record"""
+    record = process_resume_file(_scan_analyzer, path, os.path.basename(path), industry, job_description, options)
+    if isinstance(record, ResumeResult):
+        record = record.to_dict()
+    return {'path': path, 'status': record['status'], **record}
+
+
+def find_resumes(inputs):
+    """Sorted, de-duplicated resume paths from files, directories (walked recursively) and glob patterns"""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                paths.update(os.path.join(root, name) for name in files
+                             if name.lower().endswith(SUPPORTED_EXTENSIONS))
+        elif os.path.isfile(item):
+            paths.add(item)
+        else:
+            paths.update(match for match in glob.glob(item, recursive=True)
+                         if os.path.isfile(match) and match.lower().endswith(SUPPORTED_EXTENSIONS))
+    return sorted(os.path.normpath(path) for path in paths)
+
+
+class JsonlWriter:
+    def __init__(self, path):
+        self.path = path
+
+    def read_existing(self):
+        """Records already in the output; a line cut off by an interrupted run is ignored"""
+        records = []
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    def open(self):
+        self.file = open(self.path, 'a', encoding='utf-8')
+        # Start on a fresh line if the previous run died mid-record
+        if self.file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self.file.write('\n')
+
+    def write(self, record):
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvWriter:
+    def __init__(self, path):
+        self.path = path
+
+    def read_existing(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            records = []
+            for row in csv.DictReader(f):
+                if not row.get('path') or not row.get('status'):
+                    continue
+                for key in ('score', 'relevanceScore'):
+                    try:
+                        row[key] = float(row[key])
+                    except (TypeError, ValueError):
+                        row[key] = None
+                records.append(row)
+            return records
+
+    def open(self):
+        write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self.file = open(self.path, 'a', encoding='utf-8', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        if write_header:
+            self.writer.writeheader()
+
+    def write(self, record):
+        row = dict(record)
+        found_skills = record.get('foundSkills') or {}
+        row['technicalSkills'] = '; '.join(found_skills.get('technical', []))
+        row['softSkills'] = '; '.join(found_skills.get('soft', []))
+        row['certifications'] = '; '.join(found_skills.get('certifications', []))
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def scan(paths, industry, job_description, options, workers, skills_file, text_cache_path, relevance_mode):
+    """Yield an output record per path as soon as it is scored"""
+    if workers <= 1:
+        _init_scan_worker(skills_file, text_cache_path, relevance_mode)
+        for path in paths:
+            yield _scan_file(path, industry, job_description, options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker,
+                             initargs=(skills_file, text_cache_path, relevance_mode)) as pool:
+        # A bounded window keeps memory flat however many files are queued
+        pending = iter(paths)
+        in_flight = set()
+        for path in pending:
+            in_flight.add(pool.submit(_scan_file, path, industry, job_description, options))
+            if len(in_flight) >= workers * 4:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                for path in pending:
+                    in_flight.add(pool.submit(_scan_file, path, industry, job_description, options))
+                    break
+
+
+def print_top(records, top_k, out=sys.stdout):
+    """Top-K scored records, ordered like the /analyze results"""
+    scored = [record for record in records if record.get('status') == 'ok' and record.get('score') is not None]
+    top = heapq.nlargest(top_k, scored, key=lambda record: (record['relevanceScore'], record['score']))
+    print(f"\nTop {len(top)} of {len(scored)} scored resumes", file=out)
+    print(f"{'#':>4}  {'relevance':>9}  {'score':>7}  path", file=out)
+    for rank, record in enumerate(top, start=1):
+        print(f"{rank:>4}  {record['relevanceScore']:>9.1f}  {record['score']:>7.1f}  {record['path']}", file=out)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='+', help='resume files, directories or glob patterns')
+    parser.add_argument('--jd', required=True, help='file with the job description')
+    parser.add_argument('--industry', default='', help='industry key; detected from the JD when omitted')
+    parser.add_argument('--output', required=True, help='results file (.jsonl or .csv)')
+    parser.add_argument('--format', choices=('jsonl', 'csv'), help='output format; defaults to the output extension')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='worker processes (1 scans in-process)')
+    parser.add_argument('--top-k', type=int, default=20, help='size of the ranked summary printed at the end')
+    parser.add_argument('--resume', action='store_true', help='skip files already present in the output')
+    parser.add_argument('--skill-gaps', action='store_true')
+    parser.add_argument('--salary', action='store_true')
+    parser.add_argument('--culture-fit', action='store_true')
+    parser.add_argument('--skills-file', default='skills.json')
+    parser.add_argument('--text-cache', default='', help='SQLite extracted-text cache to share between runs')
+    parser.add_argument('--relevance-mode', choices=RELEVANCE_MODES, default='ngram')
+    parser.add_argument('--extraction-mode', choices=EXTRACTION_MODES, default='accurate',
+                        help="'fast' skips PDF layout analysis and caps pages and characters read")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    with open(args.jd, 'r', encoding='utf-8') as f:
+        job_description = f.read().strip()
+    if len(job_description) < 10:
+        sys.exit('Job description must be at least 10 characters long')
+
+    output_format = args.format or ('csv' if args.output.lower().endswith('.csv') else 'jsonl')
+    writer = CsvWriter(args.output) if output_format == 'csv' else JsonlWriter(args.output)
+
+    industry = args.industry
+    if not industry:
+        industry = ResumeAnalyzer(args.skills_file, relevance_mode=args.relevance_mode).detect_industry(job_description)
+        print(f"Detected industry: {industry}", file=sys.stderr)
+
+    options = {
+        'deepAnalysis': False,
+        'skillGaps': args.skill_gaps,
+        'salaryInsights': args.salary,
+        'cultureFit': args.culture_fit,
+        'extractionMode': args.extraction_mode
+    }
+
+    paths = find_resumes(args.inputs)
+    if args.resume:
+        records = writer.read_existing()
+    else:
+        records = []
+        if os.path.exists(args.output):
+            os.remove(args.output)
+    done_paths = {record['path'] for record in records}
+    todo = [path for path in paths if path not in done_paths]
+    print(f"{len(paths)} resumes found, {len(paths) - len(todo)} already in {args.output}, scanning {len(todo)}",
+          file=sys.stderr)
+
+    started = time.perf_counter()
+    stats = BatchStats()
+    writer.open()
+    try:
+        for count, record in enumerate(scan(todo, industry, job_description, options, args.workers,
+                                            args.skills_file, args.text_cache, args.relevance_mode), start=1):
+            writer.write(record)
+            records.append(record)
+            if record['status'] == 'ok':
+                stats.add_record(record)
+            if count % 100 == 0 or count == len(todo):
+                print(f"{count}/{len(todo)} scanned", file=sys.stderr)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    rate = len(todo) / elapsed if elapsed > 0 else 0
+    print(f"Scanned {len(todo)} files in {elapsed:.1f}s ({rate:.1f}/s); this run: {json.dumps(stats.to_dict())}",
+          file=sys.stderr)
+    print_top(records, args.top_k)
+
+
+if __name__ == '__main__':
+    main()
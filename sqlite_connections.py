@@ -0,0 +1,33 @@
+import os
+import sqlite3
+import threading
+
+
+class ThreadLocalConnections:
+    """WAL-mode sqlite3 connections to one database file, opened lazily, one per thread.
+
+    sqlite3 connections cannot be shared between threads, so each thread
+    that calls ``get`` keeps its own. WAL lets readers in any thread or
+    worker process run alongside the single writer, and ``synchronous=NORMAL``
+    only syncs at checkpoints, which is safe in WAL mode. The database's
+    directory is created if it does not exist yet.
+    """
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self):
+        """The current thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -76,7 +76,8 @@ class ResumeScanner {
         const validFiles = files.filter(file => 
             file.type === 'application/pdf' || 
             file.type === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' ||
-            file.type === 'text/plain'
+            file.type === 'text/plain' ||
+            /\.(zip|tar|tar\.gz|tgz)$/i.test(file.name)
         );
 
         validFiles.forEach(file => {
@@ -141,6 +142,8 @@ class ResumeScanner {
         const skillGaps = document.getElementById('skillGaps').checked;
         const salaryInsights = document.getElementById('salaryInsights').checked;
         const cultureFit = document.getElementById('cultureFit').checked;
+        const fastExtraction = document.getElementById('fastExtraction');
+        const deduplicate = document.getElementById('deduplicate');
 
         this.jobDescription = jobDesc;
         this.selectedIndustry = industry;
@@ -148,6 +151,8 @@ class ResumeScanner {
         document.getElementById('resultsSection').style.display = 'block';
         document.getElementById('loadingIndicator').style.display = 'block';
         document.getElementById('resumeResults').innerHTML = '';
+        document.getElementById('statsContainer').innerHTML = '';
+        this.updateProgress(0, 0);
 
         const formData = new FormData();
         formData.append('jobDescription', jobDesc);
@@ -156,32 +161,71 @@ class ResumeScanner {
         formData.append('skillGaps', skillGaps ? 'on' : 'off');
         formData.append('salaryInsights', salaryInsights ? 'on' : 'off');
         formData.append('cultureFit', cultureFit ? 'on' : 'off');
+        // Left as rendered, the server's PDF_EXTRACTION_MODE and DEDUPLICATE settings apply
+        if (fastExtraction.checked !== fastExtraction.defaultChecked) {
+            formData.append('extractionMode', fastExtraction.checked ? 'fast' : 'accurate');
+        }
+        if (deduplicate.checked !== deduplicate.defaultChecked) {
+            formData.append('deduplicate', deduplicate.checked ? 'on' : 'off');
+        }
 
         this.resumes.forEach(resume => {
             formData.append('resumes', resume.file);
         });
 
         try {
-            const response = await fetch('/analyze', {
+            const response = await fetch('/analyze/stream', {
                 method: 'POST',
                 body: formData
             });
 
-            const text = await response.text(); 
-            let data;
-            try {
-                data = JSON.parse(text);
-            } catch (err) {
-                throw new Error("Invalid JSON response: " + text);
-            }
-
             if (!response.ok) {
+                const text = await response.text();
+                let data;
+                try {
+                    data = JSON.parse(text);
+                } catch (err) {
+                    throw new Error("Invalid JSON response: " + text);
+                }
                 throw new Error(data.error || 'Analysis failed');
             }
 
-            this.results = data.results;
+            // Rows are rendered as they arrive; the final stats message re-ranks them
+            this.results = [];
+            const skipped = [];
+            let totalFiles = 0;
+            let summary = null;
+
+            await this.readStream(response, message => {
+                if (message.type === 'start') {
+                    totalFiles = message.files;
+                    this.updateProgress(0, totalFiles);
+                } else if (message.type === 'result') {
+                    this.results.push(message.result);
+                    document.getElementById('resumeResults').appendChild(this.createResultCard(message.result, null));
+                    this.updateProgress(this.results.length + skipped.length, totalFiles);
+                } else if (message.type === 'failure') {
+                    skipped.push(message.failure);
+                    console.warn(`Skipped ${message.failure.name}: ${message.failure.status}`);
+                    this.updateProgress(this.results.length + skipped.length, totalFiles);
+                } else if (message.type === 'duplicate') {
+                    skipped.push(message.duplicate);
+                    console.info(`${message.duplicate.name} duplicates ${message.duplicate.duplicateOf}`);
+                    this.updateProgress(this.results.length + skipped.length, totalFiles);
+                } else if (message.type === 'stats') {
+                    summary = message;
+                } else if (message.type === 'error') {
+                    throw new Error(message.error);
+                }
+            });
+
+            if (!summary) {
+                throw new Error('Analysis ended before all results were received');
+            }
+
+            this.results.sort((a, b) => (b.relevanceScore - a.relevanceScore) || (b.score - a.score));
             this.renderFilters();
-            this.renderStats(data.stats);
+            this.renderStats(summary.stats);
             this.displayResults(this.results);
         } catch (error) {
             console.error('Error analyzing resumes:', error);
@@ -191,6 +235,37 @@ class ResumeScanner {
         }
     }
 
+    async readStream(response, onMessage) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (value) {
+                buffer += decoder.decode(value, { stream: true });
+            }
+
+            const lines = buffer.split('\n');
+            buffer = done ? '' : lines.pop();
+            lines.filter(line => line.trim()).forEach(line => onMessage(JSON.parse(line)));
+
+            if (done) break;
+        }
+    }
+
+    updateProgress(processed, total) {
+        const label = document.querySelector('#loadingIndicator p');
+        if (total > 0) {
+            label.textContent = `Analyzed ${processed} of ${total} resumes...`;
+        } else if (processed > 0) {
+            // Archive uploads do not announce how many resumes they hold
+            label.textContent = `Analyzed ${processed} resumes...`;
+        } else {
+            label.textContent = 'AI analyzing resumes across multiple dimensions...';
+        }
+    }
+
     showError(message) {
         const resultsContainer = document.getElementById('resumeResults');
         resultsContainer.innerHTML = `
@@ -362,162 +437,170 @@ class ResumeScanner {
             return;
         }
 
-        
         results.forEach((result, index) => {
-            const div = document.createElement('div');
-            div.className = 'result-card';
+            container.appendChild(this.createResultCard(result, index));
+        });
+
+        this.addExportButton(results);
+    }
+
+    createResultCard(result, index) {
+        // index is the rank in the sorted list, or null while results are still streaming in
+        const div = document.createElement('div');
+        div.className = 'result-card';
 
-            const rankingClass = index < 3 ? 'top-candidate' : '';
-            div.classList.add(rankingClass);
+        if (index !== null && index < 3) {
+            div.classList.add('top-candidate');
+        }
+
+        div.innerHTML = `
+            <div class="result-header">
+                <h3></h3>
+                <div class="result-badges">
+                    ${index === 0 ? '<span class="badge badge-gold">Top Match</span>' : ''}
+                    ${index === 1 ? '<span class="badge badge-silver">2nd Best</span>' : ''}
+                    ${index === 2 ? '<span class="badge badge-bronze">3rd Best</span>' : ''}
+                </div>
+            </div>
             
-            div.innerHTML = `
-                <div class="result-header">
-                    <h3>${result.name}</h3>
-                    <div class="result-badges">
-                        ${index === 0 ? '<span class="badge badge-gold">Top Match</span>' : ''}
-                        ${index === 1 ? '<span class="badge badge-silver">2nd Best</span>' : ''}
-                        ${index === 2 ? '<span class="badge badge-bronze">3rd Best</span>' : ''}
+            <div class="result-summary">
+                <p><strong>Analysis Summary:</strong> ${result.summary}</p>
+            </div>
+            
+            <div class="result-metrics">
+                <div class="metric-card">
+                    <div class="metric-label">JD Relevance</div>
+                    <div class="metric-value ${this.getRelevanceClass(result.relevanceScore)}">
+                        ${result.relevanceScore}%
                     </div>
                 </div>
-                
-                <div class="result-summary">
-                    <p><strong>Analysis Summary:</strong> ${result.summary}</p>
+                <div class="metric-card">
+                    <div class="metric-label">Overall Score</div>
+                    <div class="metric-value ${this.getScoreClass(result.score)}">
+                        ${result.score}
+                    </div>
                 </div>
-                
-                <div class="result-metrics">
-                    <div class="metric-card">
-                        <div class="metric-label">JD Relevance</div>
-                        <div class="metric-value ${this.getRelevanceClass(result.relevanceScore)}">
-                            ${result.relevanceScore}%
-                        </div>
+                <div class="metric-card">
+                    <div class="metric-label">Experience Level</div>
+                    <div class="metric-value">
+                        ${this.getExperienceLabel(result.experienceLevel)}
                     </div>
-                    <div class="metric-card">
-                        <div class="metric-label">Overall Score</div>
-                        <div class="metric-value ${this.getScoreClass(result.score)}">
-                            ${result.score}
-                        </div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-label">JD Skill Matches</div>
+                    <div class="metric-value">
+                        ${result.jdSkillMatches}
                     </div>
-                    <div class="metric-card">
-                        <div class="metric-label">Experience Level</div>
-                        <div class="metric-value">
-                            ${this.getExperienceLabel(result.experienceLevel)}
+                </div>
+            </div>
+            
+            <div class="contact-info">
+                <p><strong>Email:</strong> ${result.email}</p>
+                <p><strong>Phone:</strong> ${result.phone}</p>
+            </div>
+            
+            <div class="skills-section">
+                <h4>Skills Matched:</h4>
+                <div class="skills-grid">
+                    <div class="skill-category">
+                        <strong>Technical Skills:</strong>
+                        <div class="skill-tags">
+                            ${result.foundSkills.technical.length > 0 
+                                ? result.foundSkills.technical.map(skill => 
+                                    `<span class="skill-tag technical">${skill}</span>`
+                                ).join('')
+                                : '<span class="no-skills">None found</span>'
+                            }
                         </div>
                     </div>
-                    <div class="metric-card">
-                        <div class="metric-label">JD Skill Matches</div>
-                        <div class="metric-value">
-                            ${result.jdSkillMatches}
+                    <div class="skill-category">
+                        <strong>Soft Skills:</strong>
+                        <div class="skill-tags">
+                            ${result.foundSkills.soft.length > 0 
+                                ? result.foundSkills.soft.map(skill => 
+                                    `<span class="skill-tag soft">${skill}</span>`
+                                ).join('')
+                                : '<span class="no-skills">None found</span>'
+                            }
                         </div>
                     </div>
-                </div>
-                
-                <div class="contact-info">
-                    <p><strong>Email:</strong> ${result.email}</p>
-                    <p><strong>Phone:</strong> ${result.phone}</p>
-                </div>
-                
-                <div class="skills-section">
-                    <h4>Skills Matched:</h4>
-                    <div class="skills-grid">
-                        <div class="skill-category">
-                            <strong>Technical Skills:</strong>
-                            <div class="skill-tags">
-                                ${result.foundSkills.technical.length > 0 
-                                    ? result.foundSkills.technical.map(skill => 
-                                        `<span class="skill-tag technical">${skill}</span>`
-                                    ).join('')
-                                    : '<span class="no-skills">None found</span>'
-                                }
-                            </div>
-                        </div>
-                        <div class="skill-category">
-                            <strong>Soft Skills:</strong>
-                            <div class="skill-tags">
-                                ${result.foundSkills.soft.length > 0 
-                                    ? result.foundSkills.soft.map(skill => 
-                                        `<span class="skill-tag soft">${skill}</span>`
-                                    ).join('')
-                                    : '<span class="no-skills">None found</span>'
-                                }
-                            </div>
-                        </div>
-                        <div class="skill-category">
-                            <strong>Certifications:</strong>
-                            <div class="skill-tags">
-                                ${result.foundSkills.certifications.length > 0 
-                                    ? result.foundSkills.certifications.map(skill => 
-                                        `<span class="skill-tag certification">${skill}</span>`
-                                    ).join('')
-                                    : '<span class="no-skills">None found</span>'
-                                }
-                            </div>
+                    <div class="skill-category">
+                        <strong>Certifications:</strong>
+                        <div class="skill-tags">
+                            ${result.foundSkills.certifications.length > 0 
+                                ? result.foundSkills.certifications.map(skill => 
+                                    `<span class="skill-tag certification">${skill}</span>`
+                                ).join('')
+                                : '<span class="no-skills">None found</span>'
+                            }
                         </div>
                     </div>
                 </div>
-                
-                <div class="additional-info">
-                    ${result.gapAnalysis ? `
-                        <details class="gap-analysis">
-                            <summary><strong>Skill Gaps Analysis</strong></summary>
-                            <div class="gap-content">
-                                <div class="gap-category">
-                                    <strong>Technical Gaps:</strong>
-                                    <div class="gap-tags">
-                                        ${result.gapAnalysis.technical.length > 0 
-                                            ? result.gapAnalysis.technical.map(skill => 
-                                                `<span class="gap-tag technical">${skill}</span>`
-                                            ).join('')
-                                            : '<span class="no-gaps">No gaps identified</span>'
-                                        }
-                                    </div>
+            </div>
+            
+            <div class="additional-info">
+                ${result.gapAnalysis ? `
+                    <details class="gap-analysis">
+                        <summary><strong>Skill Gaps Analysis</strong></summary>
+                        <div class="gap-content">
+                            <div class="gap-category">
+                                <strong>Technical Gaps:</strong>
+                                <div class="gap-tags">
+                                    ${result.gapAnalysis.technical.length > 0 
+                                        ? result.gapAnalysis.technical.map(skill => 
+                                            `<span class="gap-tag technical">${skill}</span>`
+                                        ).join('')
+                                        : '<span class="no-gaps">No gaps identified</span>'
+                                    }
                                 </div>
-                                <div class="gap-category">
-                                    <strong>Soft Skills Gaps:</strong>
-                                    <div class="gap-tags">
-                                        ${result.gapAnalysis.soft.length > 0 
-                                            ? result.gapAnalysis.soft.map(skill => 
-                                                `<span class="gap-tag soft">${skill}</span>`
-                                            ).join('')
-                                            : '<span class="no-gaps">No gaps identified</span>'
-                                        }
-                                    </div>
+                            </div>
+                            <div class="gap-category">
+                                <strong>Soft Skills Gaps:</strong>
+                                <div class="gap-tags">
+                                    ${result.gapAnalysis.soft.length > 0 
+                                        ? result.gapAnalysis.soft.map(skill => 
+                                            `<span class="gap-tag soft">${skill}</span>`
+                                        ).join('')
+                                        : '<span class="no-gaps">No gaps identified</span>'
+                                    }
                                 </div>
-                                <div class="gap-category">
-                                    <strong>Certification Gaps:</strong>
-                                    <div class="gap-tags">
-                                        ${result.gapAnalysis.certifications.length > 0 
-                                            ? result.gapAnalysis.certifications.map(skill => 
-                                                `<span class="gap-tag certification">${skill}</span>`
-                                            ).join('')
-                                            : '<span class="no-gaps">No gaps identified</span>'
-                                        }
-                                    </div>
+                            </div>
+                            <div class="gap-category">
+                                <strong>Certification Gaps:</strong>
+                                <div class="gap-tags">
+                                    ${result.gapAnalysis.certifications.length > 0 
+                                        ? result.gapAnalysis.certifications.map(skill => 
+                                            `<span class="gap-tag certification">${skill}</span>`
+                                        ).join('')
+                                        : '<span class="no-gaps">No gaps identified</span>'
+                                    }
                                 </div>
                             </div>
-                        </details>
+                        </div>
+                    </details>
+                ` : ''}
+                
+                <div class="extra-metrics">
+                    ${result.salaryEstimate ? `
+                        <div class="metric-item">
+                            <strong>Estimated Salary:</strong> 
+                            <span class="salary-estimate">${result.salaryEstimate}</span>
+                        </div>
+                    ` : ''}
+                    ${result.cultureMatch ? `
+                        <div class="metric-item">
+                            <strong>Culture Fit:</strong> 
+                            <span class="culture-fit">${result.cultureMatch}</span>
+                        </div>
                     ` : ''}
-                    
-                    <div class="extra-metrics">
-                        ${result.salaryEstimate ? `
-                            <div class="metric-item">
-                                <strong>Estimated Salary:</strong> 
-                                <span class="salary-estimate">${result.salaryEstimate}</span>
-                            </div>
-                        ` : ''}
-                        ${result.cultureMatch ? `
-                            <div class="metric-item">
-                                <strong>Culture Fit:</strong> 
-                                <span class="culture-fit">${result.cultureMatch}</span>
-                            </div>
-                        ` : ''}
-                    </div>
                 </div>
-            `;
-            
-            container.appendChild(div);
-        });
+            </div>
+        `;
 
-        this.addExportButton(results);
+        // Names come from uploaded filenames and archive paths, so they are set as text, never markup
+        div.querySelector('.result-header h3').textContent = result.name;
+
+        return div;
     }
 
     addExportButton(results) {
@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+
+from sqlite_connections import ThreadLocalConnections
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractedTextCache:
+    """Content-addressed SQLite cache of extracted resume text.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the file type
+    and an extractor version, so every worker process sharing the database
+    file skips parsing for a resume any of them has seen before, and bumping
+    the version invalidates text produced by an older extractor. The least
+    recently used entries are evicted once the stored text exceeds
+    ``max_bytes``.
+
+    Hits only read: their access times are buffered in memory and written
+    in one batch every ``touch_batch`` hits or ``touch_interval`` seconds,
+    and before any eviction. Triggers keep the total text size in a
+    one-row table, so writes never sum the whole cache.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024, version=1, touch_batch=256, touch_interval=30.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = str(version)
+        self.touch_batch = touch_batch
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._connections = ThreadLocalConnections(path)
+        self._stats_lock = threading.Lock()
+        self._touch_lock = threading.Lock()
+        self._pending_touches = {}
+        self._last_touch_flush = time.monotonic()
+
+        conn = self._connections.get()
+        # One write transaction, so a database created by an older release is
+        # seeded with its current total before the size triggers exist
+        conn.executescript(
+            "BEGIN IMMEDIATE;"
+            "CREATE TABLE IF NOT EXISTS extracted_text ("
+            " key TEXT PRIMARY KEY,"
+            " version TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_extracted_text_access ON extracted_text (last_access);"
+            "CREATE TABLE IF NOT EXISTS extracted_text_size ("
+            " id INTEGER PRIMARY KEY CHECK (id = 0),"
+            " bytes INTEGER NOT NULL);"
+            "INSERT OR IGNORE INTO extracted_text_size SELECT 0, COALESCE(SUM(size), 0) FROM extracted_text;"
+            "CREATE TRIGGER IF NOT EXISTS extracted_text_size_insert AFTER INSERT ON extracted_text BEGIN"
+            " UPDATE extracted_text_size SET bytes = bytes + NEW.size WHERE id = 0; END;"
+            "CREATE TRIGGER IF NOT EXISTS extracted_text_size_delete AFTER DELETE ON extracted_text BEGIN"
+            " UPDATE extracted_text_size SET bytes = bytes - OLD.size WHERE id = 0; END;"
+            "CREATE TRIGGER IF NOT EXISTS extracted_text_size_update AFTER UPDATE OF size ON extracted_text BEGIN"
+            " UPDATE extracted_text_size SET bytes = bytes + NEW.size - OLD.size WHERE id = 0; END;"
+            "COMMIT;"
+        )
+        # Text from other extractor versions can never be hit again
+        conn.execute("DELETE FROM extracted_text WHERE version != ?", (self.version,))
+        conn.commit()
+
+    def make_key(self, data, kind):
+        """Key for file bytes of a given type ('pdf', 'docx', ...) under the current version"""
+        return f"{hashlib.sha256(data).hexdigest()}:{kind}:{self.version}"
+
+    def get(self, key):
+        """Return cached text for a key, or None on a miss"""
+        try:
+            conn = self._connections.get()
+            row = conn.execute("SELECT text FROM extracted_text WHERE key = ?", (key,)).fetchone()
+            if row is not None and self._touch(key):
+                self._flush_touches(conn)
+        except sqlite3.Error as e:
+            logger.error(f"Error reading extracted text cache: {e}")
+            row = None
+
+        with self._stats_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return row[0] if row is not None else None
+
+    def put(self, key, text):
+        try:
+            conn = self._connections.get()
+            # An upsert rather than INSERT OR REPLACE: REPLACE deletes without firing the size trigger
+            conn.execute(
+                "INSERT INTO extracted_text (key, version, text, size, last_access) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET version = excluded.version, text = excluded.text,"
+                " size = excluded.size, last_access = excluded.last_access",
+                (key, self.version, text, len(text.encode('utf-8')), time.time())
+            )
+            conn.commit()
+            self._evict(conn)
+        except sqlite3.Error as e:
+            logger.error(f"Error writing extracted text cache: {e}")
+
+    def _touch(self, key):
+        """Buffer a hit's access time; True once the buffer is due to be written"""
+        now = time.monotonic()
+        with self._touch_lock:
+            self._pending_touches[key] = time.time()
+            return (len(self._pending_touches) >= self.touch_batch
+                    or now - self._last_touch_flush >= self.touch_interval)
+
+    def _flush_touches(self, conn):
+        with self._touch_lock:
+            touches = self._pending_touches
+            self._pending_touches = {}
+            self._last_touch_flush = time.monotonic()
+        if not touches:
+            return
+        # MAX keeps a newer access another worker already wrote
+        conn.executemany(
+            "UPDATE extracted_text SET last_access = MAX(last_access, ?) WHERE key = ?",
+            [(accessed, key) for key, accessed in touches.items()]
+        )
+        conn.commit()
+
+    def _total_bytes(self, conn):
+        return conn.execute("SELECT bytes FROM extracted_text_size WHERE id = 0").fetchone()[0]
+
+    def _evict(self, conn):
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+        # Eviction order must see the hits buffered since the last flush
+        self._flush_touches(conn)
+
+        # Oldest first until the cache is back under budget
+        excess = total - self.max_bytes
+        stale_keys = []
+        for key, size in conn.execute("SELECT key, size FROM extracted_text ORDER BY last_access"):
+            stale_keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM extracted_text WHERE key = ?", stale_keys)
+        conn.commit()
+
+    def clear(self):
+        conn = self._connections.get()
+        with self._touch_lock:
+            self._pending_touches.clear()
+        conn.execute("DELETE FROM extracted_text")
+        conn.commit()
+
+    def stats(self):
+        conn = self._connections.get()
+        entries = conn.execute("SELECT COUNT(*) FROM extracted_text").fetchone()[0]
+        size = self._total_bytes(conn)
+        with self._stats_lock:
+            return {
+                'entries': entries,
+                'bytes': size,
+                'maxBytes': self.max_bytes,
+                'version': self.version,
+                'hits': self.hits,
+                'misses': self.misses
+            }